@@ -5,6 +5,27 @@ Configuration:
 	 API key that will be forwarded to the Julia process as `NREL_DEVELOPER_API_KEY`.
 	 This avoids placing secrets in user shell files and keeps the key local to the
 	 backend process environment.
+ - Set `REOPT_MAX_CONCURRENCY` to cap how many Julia solver processes run at
+	 once (defaults to the CPU count). Additional runs report `"queued"` until a
+	 slot frees up.
+ - Set `REOPT_JULIA_WORKERS` to a positive number to start that many long-lived
+	 Julia workers (`scripts/worker.jl`) with the API and send runs to them
+	 instead of launching `julia scripts/run_reopt.jl` per run. This pays
+	 REopt's package load and compilation once per worker rather than per run.
+ - Set `REOPT_COMPRESS_RESULTS=1` to store completed results as gzip-compressed
+	 `result.json.gz`; the result endpoints read either form.
+ - Set `REOPT_SPOOL_DIR` (e.g. `/dev/shm`) to keep the scenario and result files
+	 Julia reads and writes in RAM; the result is moved into the run directory
+	 when the run finishes. Ignored if the directory is not writable.
+ - Set `REOPT_GZIP_RESPONSES=1` to gzip responses over 64 KiB (i.e. completed
+	 results) for clients that send `Accept-Encoding: gzip`. Worth it when the
+	 frontend reaches the API over a network rather than localhost.
+ - Set `REOPT_ECHO_JULIA_OUTPUT=1` to also print Julia's stdout/stderr to the
+	 server console as it arrives. Off by default; the output is always written
+	 to the run's `stdout.log` and `stderr.log`.
+ - Set `REOPT_ALLOW_ORIGINS` to a comma-separated list of origins allowed to call
+	 the API from a browser (CORS). Defaults to the local Streamlit app,
+	 `http://localhost:8501`.
 
 Example:
 	export REOPT_NREL_API_KEY="your_api_key_here"
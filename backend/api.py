@@ -1,43 +1,331 @@
 import asyncio
-import json
+import gzip
+import hashlib
+import logging
 import os
+import shutil
+import time
 import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException, Query, Body
-from pydantic import BaseModel
-import copy
+import numpy as np
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 # --- optional CORS so Streamlit/frontend can call this API ---
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+log = logging.getLogger("reopt.api")
 
 # Configuration via environment variables
 PROJECT_ROOT = Path(os.getenv("REOPT_PROJECT_ROOT", Path(__file__).resolve().parents[1]))
 RUNS_DIR = Path(os.getenv("REOPT_RUNS_DIR", Path(__file__).parent / "runs"))
 DEFAULT_SOLVER = os.getenv("REOPT_SOLVER", "HiGHS")
+# Upper bound on Julia solver processes running at once; further runs queue
+MAX_CONCURRENT_RUNS = int(os.getenv("REOPT_MAX_CONCURRENCY", os.cpu_count() or 2))
+# Number of persistent Julia workers to keep warm (0 = one process per run)
+JULIA_WORKERS = int(os.getenv("REOPT_JULIA_WORKERS", "0"))
+# Gzip result.json once a run completes; reads transparently decompress
+COMPRESS_RESULTS = os.getenv("REOPT_COMPRESS_RESULTS", "").lower() in ("1", "true", "yes")
+# Optional RAM-backed directory (e.g. /dev/shm) for the scenario/result files
+# Julia reads and writes; results are moved into RUNS_DIR when a run finishes
+SPOOL_DIR = Path(os.environ["REOPT_SPOOL_DIR"]) if os.getenv("REOPT_SPOOL_DIR") else None
+# Echo Julia stdout/stderr to the server console as it arrives (off by default)
+ECHO_JULIA_OUTPUT = os.getenv("REOPT_ECHO_JULIA_OUTPUT", "").lower() in ("1", "true", "yes")
+# How much of the end of Julia's stderr is checked and kept in an error status
+LOG_TAIL_BYTES = 16 * 1024
 
 RUNS_DIR.mkdir(parents=True, exist_ok=True)
 
-app = FastAPI(title="REopt Runner")
+_JULIA_SLOTS = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+# status.json values after which a run no longer changes
+_TERMINAL_STATUSES = frozenset({"completed", "error"})
+# Consecutive non-terminal /status polls per run, used to grow Retry-After.
+# Bounded so abandoned runs don't accumulate.
+_POLL_COUNTS: "OrderedDict[str, int]" = OrderedDict()
+_MAX_TRACKED_POLLS = 4096
+
+
+class JuliaWorkerPool:
+    """Long-lived `julia scripts/worker.jl` processes that keep REopt loaded
+    between runs, so only a worker's first job pays Julia's startup and
+    compilation cost. Jobs and replies are exchanged as one JSON object per
+    line over the worker's stdin/stdout.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        # every live worker, idle or busy, so close() can stop them all
+        self._procs: set = set()
+
+    async def start(self) -> None:
+        for _ in range(self.size):
+            self._idle.put_nowait(await self._spawn())
+
+    async def close(self) -> None:
+        """Stop every worker, including ones still busy with a job; their
+        pending run() calls then report the worker's exit as an error."""
+        procs, self._procs = self._procs, set()
+        for proc in procs:
+            if proc.returncode is None:
+                proc.terminate()
+        for proc in procs:
+            await proc.wait()
+
+    async def _spawn(self):
+        # Worker stderr (REopt/solver logging) goes to the server's stderr
+        proc = await asyncio.create_subprocess_exec(
+            "julia",
+            str(PROJECT_ROOT / "scripts" / "worker.jl"),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        self._procs.add(proc)
+        return proc
+
+    def _discard(self, proc) -> None:
+        """Kill a worker whose stdout may no longer line up with its jobs."""
+        self._procs.discard(proc)
+        if proc.returncode is None:
+            proc.kill()
+
+    async def run(self, job: dict, on_start=None) -> dict:
+        """Run one job on the next idle worker and return its reply.
+
+        `on_start`, if given, is awaited once a worker has been picked. A
+        worker found dead is replaced before use; one that dies mid-job is
+        reported as an error and replaced on its next use. A worker whose
+        reply can't be read or belongs to another job is killed and replaced
+        too, so a stray line can never complete the wrong run.
+        """
+        proc = await self._idle.get()
+        try:
+            if proc is None or proc.returncode is not None:
+                self._procs.discard(proc)
+                proc = await self._spawn()
+            if on_start is not None:
+                await on_start()
+            job_id = uuid.uuid4().hex
+            try:
+                try:
+                    proc.stdin.write(orjson.dumps({**job, "id": job_id}) + b"\n")
+                    await proc.stdin.drain()
+                    line = await proc.stdout.readline()
+                except (BrokenPipeError, ConnectionResetError):
+                    line = b""
+                if not line:
+                    returncode = await proc.wait()
+                    return {"ok": False, "error": f"Julia worker exited with code {returncode}"}
+                reply = orjson.loads(line)
+                if not isinstance(reply, dict) or reply.get("id") != job_id:
+                    raise ValueError("reply does not belong to this job")
+                return reply
+            except BaseException as exc:
+                # oversized or garbled reply, or run() cancelled mid-job
+                self._discard(proc)
+                bad, proc = proc, None
+                if not isinstance(exc, Exception):
+                    raise
+                await bad.wait()
+                return {"ok": False, "error": f"Julia worker failed: {exc}"}
+        finally:
+            # None stands in for a discarded worker; it is respawned on next use
+            self._idle.put_nowait(proc)
+
+
+# Set at startup when REOPT_JULIA_WORKERS > 0; otherwise every run spawns
+# its own `julia scripts/run_reopt.jl` process.
+JULIA_POOL: Optional[JuliaWorkerPool] = None
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    global JULIA_POOL
+    if JULIA_WORKERS > 0:
+        JULIA_POOL = JuliaWorkerPool(JULIA_WORKERS)
+        await JULIA_POOL.start()
+    try:
+        yield
+    finally:
+        if JULIA_POOL is not None:
+            await JULIA_POOL.close()
+            JULIA_POOL = None
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response encoded with orjson. Stands in for FastAPI's ORJSONResponse,
+    which is deprecated in current FastAPI releases."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+app = FastAPI(title="REopt Runner", default_response_class=OrjsonResponse, lifespan=_lifespan)
 
-# Allow all origins by default; tighten for production if you want
+# Only the configured frontend origins (comma-separated) may call the API;
+# defaults to the local Streamlit app.
+ALLOW_ORIGINS = [
+    o.strip() for o in os.getenv("REOPT_ALLOW_ORIGINS", "http://localhost:8501").split(",") if o.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],        # e.g., ["http://localhost:8501"]
+    allow_origins=ALLOW_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
 )
 
+# gzip large responses (completed results) for clients that accept it. Off by
+# default: next to a local frontend the compression costs more than it saves.
+if os.getenv("REOPT_GZIP_RESPONSES", "").lower() in ("1", "true", "yes"):
+    app.add_middleware(GZipMiddleware, minimum_size=64 * 1024, compresslevel=5)
+
+
+# ElectricTariff keyword arguments accepted by the Julia constructor
+_ALLOWED_TX_KEYS = frozenset({
+    "urdb_label",
+    "urdb_response",
+    "urdb_utility_name",
+    "urdb_rate_name",
+    "year",
+    "time_steps_per_hour",
+    "NEM",
+    "wholesale_rate",
+    "export_rate_beyond_net_metering_limit",
+    "monthly_energy_rates",
+    "monthly_demand_rates",
+    "blended_annual_energy_rate",
+    "blended_annual_demand_rate",
+    "add_monthly_rates_to_urdb_rate",
+    "tou_energy_rates_per_kwh",
+    "add_tou_energy_rates_to_urdb_rate",
+    "remove_tiers",
+    "demand_lookback_months",
+    "demand_lookback_percent",
+    "demand_lookback_range",
+    "coincident_peak_load_active_time_steps",
+    "coincident_peak_load_charge_per_kw",
+})
+
+# Financial keyword arguments accepted by the Julia constructor
+_ALLOWED_FIN_KEYS = frozenset({
+    "analysis_years",
+    "offtaker_discount_rate_fraction",
+    "elec_cost_escalation_rate_fraction",
+    "om_cost_escalation_rate_fraction",
+    "offtaker_tax_rate_fraction",
+    "third_party_ownership",
+    "owner_tax_rate_fraction",
+    "owner_discount_rate_fraction",
+    "existing_boiler_fuel_cost_escalation_rate_fraction",
+    "boiler_fuel_cost_escalation_rate_fraction",
+    "chp_fuel_cost_escalation_rate_fraction",
+    "generator_fuel_cost_escalation_rate_fraction",
+    "value_of_lost_load_per_kwh",
+    "microgrid_upgrade_cost_fraction",
+    "macrs_five_year",
+    "macrs_seven_year",
+    "offgrid_other_capital_costs",
+    "offgrid_other_annual_costs",
+    "min_initial_capital_costs_before_incentives",
+    "max_initial_capital_costs_before_incentives",
+    "CO2_cost_per_tonne",
+    "CO2_cost_escalation_rate_fraction",
+    "NOx_grid_cost_per_tonne",
+    "SO2_grid_cost_per_tonne",
+    "PM25_grid_cost_per_tonne",
+    "NOx_onsite_fuelburn_cost_per_tonne",
+    "SO2_onsite_fuelburn_cost_per_tonne",
+    "PM25_onsite_fuelburn_cost_per_tonne",
+    "NOx_cost_escalation_rate_fraction",
+    "SO2_cost_escalation_rate_fraction",
+    "PM25_cost_escalation_rate_fraction",
+})
+
+
+class ElectricLoad(BaseModel):
+    """ElectricLoad with the fields the normalizer relies on typed; any other
+    keys (e.g. hourly_profile) are passed through untouched."""
+    model_config = ConfigDict(extra="allow")
+
+    loads_kw: Optional[list[float]] = None
+    year: Optional[int] = None
+    time_steps_per_hour: Optional[int] = None
+
 
 class Scenario(BaseModel):
     """Minimal validation for REopt scenarios."""
     Site: dict
-    ElectricLoad: dict
+    ElectricLoad: ElectricLoad
     ElectricTariff: dict
 
 
+def _validate_loads(el: dict) -> np.ndarray:
+    """Check ElectricLoad.loads_kw (numeric, 8760 * time_steps_per_hour long,
+    finite, non-negative) and return it as a float64 array."""
+    loads = el.get("loads_kw")
+    try:
+        # guard against None; bare iterables (generators etc.) are materialized
+        # first, then everything is converted once to a float64 array
+        if loads is None:
+            raise ValueError("ElectricLoad.loads_kw is None")
+        if not isinstance(loads, (list, tuple)) and not hasattr(loads, "__array__"):
+            loads = list(loads)
+        loads = np.asarray(loads, dtype=np.float64)
+    except Exception as exc:
+        raise ValueError("ElectricLoad.loads_kw must be an array-like of numeric values") from exc
+    if loads.ndim != 1:
+        raise ValueError("ElectricLoad.loads_kw is not one-dimensional")
+
+    try:
+        tph = int(el.get("time_steps_per_hour", 1))
+    except Exception:
+        tph = 1
+    expected_len = 8760 * tph
+    if loads.size != expected_len:
+        raise ValueError(
+            f"ElectricLoad.loads_kw length {loads.size} does not match expected {expected_len} (8760 * time_steps_per_hour)"
+        )
+    if not np.isfinite(loads).all():
+        raise ValueError("ElectricLoad.loads_kw must contain only finite values")
+    if (loads < 0).any():
+        raise ValueError("ElectricLoad.loads_kw must not contain negative values")
+    return loads
+
+
+def _needs_normalize(scn: dict) -> bool:
+    """True unless `scn` is already in the shape _normalize_scenario produces,
+    i.e. normalizing it would change nothing. Only cheap key lookups; the
+    load profile itself is not touched."""
+    el = scn.get("ElectricLoad")
+    tx = scn.get("ElectricTariff")
+    fin = scn.get("Financial")
+    settings = scn.get("Settings") or {}
+    if not isinstance(el, dict) or not isinstance(tx, dict) or not isinstance(fin, dict):
+        return True
+    if "hourly_profile" in el and "loads_kw" not in el:
+        return True
+    if "time_steps_per_hour" not in el or "year" not in el:
+        return True
+    if el.get("off_grid_flag", False) or settings.get("off_grid_flag", False):
+        if "operating_reserve_required_fraction" not in el:
+            return True
+    elif not isinstance(el.get("operating_reserve_required_fraction"), float) or el["operating_reserve_required_fraction"] != 0.0:
+        return True
+    if not ("time_steps_per_hour" in tx and "year" in tx and "NEM" in tx):
+        return True
+    return not (tx.keys() <= _ALLOWED_TX_KEYS and fin.keys() <= _ALLOWED_FIN_KEYS)
+
+
 def _normalize_scenario(scn: dict) -> dict:
     """Normalize common shorthand fields from clients into the shapes
     expected by the Julia/REopt constructors.
@@ -46,14 +334,24 @@ def _normalize_scenario(scn: dict) -> dict:
     - ensure ElectricLoad.year and time_steps_per_hour exist (prefer Settings.tph if present)
     - force operating_reserve_required_fraction to 0.0 for on-grid scenarios
     - map simple tariff keys (energy_charge -> blended_annual_energy_rate, name -> urdb_label)
+
+    An already-normalized scenario is validated and returned as-is (the same
+    object), so callers must not mutate the result.
     """
-    s = copy.deepcopy(scn)
+    if not _needs_normalize(scn):
+        if "loads_kw" in scn["ElectricLoad"]:
+            _validate_loads(scn["ElectricLoad"])
+        return scn
+
+    # Shallow copies only: ElectricLoad and ElectricTariff are the only
+    # sections mutated below, and loads_kw can be shared with the caller.
+    s = dict(scn)
 
     # Read Settings.time_steps_per_hour if present (backwards-safe)
     settings_tph = (s.get("Settings", {}) or {}).get("time_steps_per_hour", None)
 
     # ElectricLoad normalization
-    el = s.get("ElectricLoad", {}) or {}
+    el = dict(s.get("ElectricLoad") or {})
     # legacy/front-end field -> expected REopt field
     if "hourly_profile" in el and "loads_kw" not in el:
         el["loads_kw"] = el.pop("hourly_profile")
@@ -83,29 +381,10 @@ def _normalize_scenario(scn: dict) -> dict:
 
     # Validate loads_kw if present: must be iterable and have expected length
     if "loads_kw" in el:
-        loads = el.get("loads_kw")
-        try:
-            # convert to list if not already; guard against None
-            if loads is None:
-                raise ValueError("ElectricLoad.loads_kw is None")
-            if not isinstance(loads, (list, tuple)):
-                loads = list(loads)
-                el["loads_kw"] = loads
-        except Exception:
-            raise ValueError("ElectricLoad.loads_kw must be an array-like of numeric values")
-
-        try:
-            tph = int(el.get("time_steps_per_hour", 1))
-        except Exception:
-            tph = 1
-        expected_len = 8760 * tph
-        if len(loads) != expected_len:
-            raise ValueError(
-                f"ElectricLoad.loads_kw length {len(loads)} does not match expected {expected_len} (8760 * time_steps_per_hour)"
-            )
+        el["loads_kw"] = _validate_loads(el)
 
     # ElectricTariff normalization
-    tx = s.get("ElectricTariff", {}) or {}
+    tx = dict(s.get("ElectricTariff") or {})
     # Common shorthand: single energy charge -> blended annual energy rate
     if "energy_charge" in tx and "blended_annual_energy_rate" not in tx:
         ec = tx.get("energy_charge")
@@ -126,80 +405,149 @@ def _normalize_scenario(scn: dict) -> dict:
     tx.setdefault("NEM", bool(tx.get("NEM", False)))
 
     # Only keep keys ElectricTariff constructor expects to avoid kwcall MethodError in Julia
-    allowed_tx_keys = {
-        "urdb_label",
-        "urdb_response",
-        "urdb_utility_name",
-        "urdb_rate_name",
-        "year",
-        "time_steps_per_hour",
-        "NEM",
-        "wholesale_rate",
-        "export_rate_beyond_net_metering_limit",
-        "monthly_energy_rates",
-        "monthly_demand_rates",
-        "blended_annual_energy_rate",
-        "blended_annual_demand_rate",
-        "add_monthly_rates_to_urdb_rate",
-        "tou_energy_rates_per_kwh",
-        "add_tou_energy_rates_to_urdb_rate",
-        "remove_tiers",
-        "demand_lookback_months",
-        "demand_lookback_percent",
-        "demand_lookback_range",
-        "coincident_peak_load_active_time_steps",
-        "coincident_peak_load_charge_per_kw",
-    }
-    filtered_tx = {k: v for k, v in tx.items() if k in allowed_tx_keys}
+    filtered_tx = {k: v for k, v in tx.items() if k in _ALLOWED_TX_KEYS}
     s["ElectricTariff"] = filtered_tx
 
     # Financial normalization: strip unknown keys to avoid Julia MethodError
     fin = s.get("Financial", {}) or {}
-    allowed_fin_keys = {
-        "analysis_years",
-        "offtaker_discount_rate_fraction",
-        "elec_cost_escalation_rate_fraction",
-        "om_cost_escalation_rate_fraction",
-        "offtaker_tax_rate_fraction",
-        "third_party_ownership",
-        "owner_tax_rate_fraction",
-        "owner_discount_rate_fraction",
-        "existing_boiler_fuel_cost_escalation_rate_fraction",
-        "boiler_fuel_cost_escalation_rate_fraction",
-        "chp_fuel_cost_escalation_rate_fraction",
-        "generator_fuel_cost_escalation_rate_fraction",
-        "value_of_lost_load_per_kwh",
-        "microgrid_upgrade_cost_fraction",
-        "macrs_five_year",
-        "macrs_seven_year",
-        "offgrid_other_capital_costs",
-        "offgrid_other_annual_costs",
-        "min_initial_capital_costs_before_incentives",
-        "max_initial_capital_costs_before_incentives",
-        "CO2_cost_per_tonne",
-        "CO2_cost_escalation_rate_fraction",
-        "NOx_grid_cost_per_tonne",
-        "SO2_grid_cost_per_tonne",
-        "PM25_grid_cost_per_tonne",
-        "NOx_onsite_fuelburn_cost_per_tonne",
-        "SO2_onsite_fuelburn_cost_per_tonne",
-        "PM25_onsite_fuelburn_cost_per_tonne",
-        "NOx_cost_escalation_rate_fraction",
-        "SO2_cost_escalation_rate_fraction",
-        "PM25_cost_escalation_rate_fraction",
-    }
-    filtered_fin = {k: v for k, v in fin.items() if k in allowed_fin_keys}
+    filtered_fin = {k: v for k, v in fin.items() if k in _ALLOWED_FIN_KEYS}
     s["Financial"] = filtered_fin
 
     return s
 
 
+def _read_json(path_str: str):
+    """Decode a (possibly gzip-compressed) JSON file."""
+    data = Path(path_str).read_bytes()
+    if path_str.endswith(".gz"):
+        data = gzip.decompress(data)
+    return orjson.loads(data)
+
+
+@lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int):
+    """Decode a JSON file once per (path, mtime) so polling clients don't
+    re-parse an unchanged result on every request. Callers must not mutate
+    the returned object."""
+    return _read_json(path_str)
+
+
+@lru_cache(maxsize=32)
+def _completed_status_body(path_str: str, mtime_ns: int) -> bytes:
+    """Encoded /status response for a completed run. A finished result never
+    changes, so repeat polls reuse these bytes instead of re-encoding a
+    multi-MB payload every time. Only the bytes are cached: the decoded
+    result is dropped once encoded rather than also kept in _load_json_cached."""
+    results = _read_json(path_str)
+    if isinstance(results, dict):
+        return orjson.dumps({**results, "status": "completed"})
+    return orjson.dumps({"status": "completed", "result": results})
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write to a sibling temp file and swap it into place, so a concurrent
+    /status poll never reads a partially written file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _tail(path: Path, limit: int = LOG_TAIL_BYTES) -> str:
+    """The last `limit` bytes of a log file, decoded; "" if there is no log."""
+    try:
+        with path.open("rb") as f:
+            f.seek(max(0, path.stat().st_size - limit))
+            return f.read().decode(errors="ignore")
+    except FileNotFoundError:
+        return ""
+
+
+def _work_dir(run_id: str) -> Path:
+    """Directory holding the scenario and result files Julia works on: the
+    run directory itself, or a per-run folder under SPOOL_DIR if one is set
+    and writable."""
+    if SPOOL_DIR is not None and os.access(SPOOL_DIR, os.W_OK):
+        return SPOOL_DIR / f"reopt-{run_id}"
+    return RUNS_DIR / run_id
+
+
+def _result_path(run_dir: Path) -> Path:
+    """The run's result file, preferring the compressed copy when present."""
+    gz = run_dir / "result.json.gz"
+    return gz if gz.exists() else run_dir / "result.json"
+
+
+def _compress_result(result_file: Path) -> None:
+    """Replace result.json with result.json.gz. Numeric REopt results shrink
+    several-fold, which cuts the bytes every cold /status read pulls off disk."""
+    gz = result_file.with_name(result_file.name + ".gz")
+    _atomic_write_bytes(gz, gzip.compress(result_file.read_bytes(), compresslevel=6))
+    result_file.unlink()
+
+
+# In-flight thread calls by (function, *args); see _coalesced
+_INFLIGHT: dict = {}
+
+
+async def _coalesced(fn, *args):
+    """Run fn(*args) in a worker thread, letting concurrent callers with the
+    same arguments share that one call. Several pollers hitting a freshly
+    completed run then decode its result once rather than once each."""
+    key = (fn, *args)
+    fut = _INFLIGHT.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+        _INFLIGHT[key] = fut
+        fut.add_done_callback(lambda f: _INFLIGHT.pop(key, None) if _INFLIGHT.get(key) is f else None)
+    # shield: one caller going away must not cancel the call for the others
+    return await asyncio.shield(fut)
+
+
+# Thread-offloaded variants for use inside coroutines: result files can be
+# megabytes, and decoding or writing them inline would stall every other
+# request on the event loop.
+async def _aload_json(path: Path):
+    return await _coalesced(_load_json_cached, str(path), path.stat().st_mtime_ns)
+
+
+async def _awrite_bytes(path: Path, data: bytes) -> None:
+    await asyncio.to_thread(path.write_bytes, data)
+
+
+async def _awrite_status(path: Path, status: dict) -> None:
+    await asyncio.to_thread(_atomic_write_bytes, path, orjson.dumps(status))
+
+
 async def _run_julia(run_id: str, scenario_file: Path, result_file: Path, solver: str) -> None:
     """Execute the Julia model and persist results."""
+    try:
+        await _execute_julia(run_id, scenario_file, result_file, solver)
+    finally:
+        if scenario_file.parent != RUNS_DIR / run_id:
+            # spooled run: the result has been moved out, drop the rest
+            await asyncio.to_thread(shutil.rmtree, scenario_file.parent, True)
+
+
+async def _execute_julia(run_id: str, scenario_file: Path, result_file: Path, solver: str) -> None:
     status_path = RUNS_DIR / run_id / "status.json"
     stdout_path = RUNS_DIR / run_id / "stdout.log"
     stderr_path = RUNS_DIR / run_id / "stderr.log"
-    print(f"[DEBUG] _run_julia started for run_id={run_id}")
+    log.debug("_run_julia started for run_id=%s", run_id)
+
+    if JULIA_POOL is not None:
+        job = {"scenario": str(scenario_file), "result": str(result_file), "solver": solver}
+        try:
+            reply = await JULIA_POOL.run(
+                job, on_start=lambda: _awrite_status(status_path, {"status": "running"})
+            )
+        except Exception as exc:
+            reply = {"ok": False, "error": f"Julia worker failed: {exc}"}
+        if not reply.get("ok"):
+            log.debug("Julia worker error for run_id=%s: %s", run_id, reply.get("error"))
+            await _awrite_status(status_path, {"status": "error", "error": reply.get("error", "")})
+            return
+        await _record_result(run_id, status_path, result_file)
+        return
 
     cmd = [
         "julia",
@@ -209,80 +557,130 @@ async def _run_julia(run_id: str, scenario_file: Path, result_file: Path, solver
         solver,
     ]
 
-    proc = await asyncio.create_subprocess_exec(
-        *cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    print(f"[DEBUG] Julia process started for run_id={run_id}")
-
-    async def _stream(stream, path: Path, label: str) -> str:
-        lines: list[str] = []
-        with path.open("wb") as f:
+    async def _stream(stream, path: Path, label: str) -> None:
+        # Drain the pipe in large chunks rather than line by line; the log file
+        # is buffered and only flushed when closed. Nothing is kept in memory.
+        with path.open("wb", buffering=1 << 16) as f:
             while True:
-                line = await stream.readline()
-                if not line:
+                buf = await stream.read(65536)
+                if not buf:
                     break
-                f.write(line)
-                f.flush()
-                text = line.decode(errors="ignore")
-                lines.append(text)
-                print(f"[{label}] {text.rstrip()}")
-        return "".join(lines)
-
-    stdout_task = asyncio.create_task(_stream(proc.stdout, stdout_path, "STDOUT"))
-    stderr_task = asyncio.create_task(_stream(proc.stderr, stderr_path, "STDERR"))
-    returncode = await proc.wait()
-    await stdout_task
-    stderr_text = await stderr_task
-    print(f"[DEBUG] Julia process finished for run_id={run_id} with returncode={returncode}")
+                f.write(buf)
+                if ECHO_JULIA_OUTPUT:
+                    print(f"[{label}] {buf.decode(errors='ignore').rstrip()}")
+
+    # Wait for a free solver slot; the run stays "queued" until then
+    async with _JULIA_SLOTS:
+        await _awrite_status(status_path, {"status": "running"})
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        log.debug("Julia process started for run_id=%s", run_id)
+
+        stdout_task = asyncio.create_task(_stream(proc.stdout, stdout_path, "STDOUT"))
+        stderr_task = asyncio.create_task(_stream(proc.stderr, stderr_path, "STDERR"))
+        returncode = await proc.wait()
+        await asyncio.gather(stdout_task, stderr_task)
+    # Diagnostics only need the end of stderr
+    stderr_text = await asyncio.to_thread(_tail, stderr_path)
+    log.debug("Julia process finished for run_id=%s with returncode=%s", run_id, returncode)
 
     RUNS_DIR.joinpath(run_id).mkdir(parents=True, exist_ok=True)
-    print(f"[DEBUG] Wrote stdout and stderr for run_id={run_id}")
+    log.debug("Wrote stdout and stderr for run_id=%s", run_id)
 
     # Even if returncode == 0, check stderr for fatal keywords (MethodError/ERROR)
     if returncode != 0 or (stderr_text and ("MethodError" in stderr_text or "ERROR" in stderr_text)):
-        print(f"[DEBUG] Julia process error for run_id={run_id}: returncode={returncode}")
+        log.debug("Julia process error for run_id=%s: returncode=%s", run_id, returncode)
         status = {"status": "error", "returncode": returncode}
         if stderr_text:
             status["error"] = stderr_text
-        status_path.write_text(json.dumps(status))
+        await _awrite_status(status_path, status)
         return
 
+    await _record_result(run_id, status_path, result_file)
+
+
+async def _record_result(run_id: str, status_path: Path, result_file: Path) -> None:
+    """Mark a finished run completed if it produced a readable result.json."""
     try:
-        # Ensure result.json exists; otherwise status will be error below
-        data = json.loads(result_file.read_text())
+        run_result = RUNS_DIR / run_id / "result.json"
+        if result_file != run_result and result_file.exists():
+            await asyncio.to_thread(shutil.move, result_file, run_result)
+            result_file = run_result
+        # Ensure result.json exists and decodes; otherwise status will be error
+        # below. Uncached: the file may be compressed (and removed) next.
+        await asyncio.to_thread(_read_json, str(result_file))
+        if COMPRESS_RESULTS:
+            await asyncio.to_thread(_compress_result, result_file)
         status = {"status": "completed"}
-        status_path.write_text(json.dumps(status))
-        print(f"[DEBUG] Run completed for run_id={run_id}")
+        await _awrite_status(status_path, status)
+        log.debug("Run completed for run_id=%s", run_id)
     except Exception as exc:  # pragma: no cover - defensive
         status = {"status": "error", "error": str(exc)}
-        status_path.write_text(json.dumps(status))
-        print(f"[DEBUG] Exception in _run_julia for run_id={run_id}: {exc}")
+        await _awrite_status(status_path, status)
+        log.debug("Exception in _run_julia for run_id=%s: %s", run_id, exc)
+
+
+# /reopt/run validates its raw body itself, so FastAPI doesn't see the
+# Scenario model; publish its schema (and nested models) under
+# components/schemas by hand so the endpoint's $ref resolves in /docs.
+_SCENARIO_SCHEMA = Scenario.model_json_schema(ref_template="#/components/schemas/{model}")
+_SCENARIO_SCHEMAS = {**_SCENARIO_SCHEMA.pop("$defs", {}), "Scenario": _SCENARIO_SCHEMA}
+
 
+def _openapi() -> dict:
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(_SCENARIO_SCHEMAS)
+    return app.openapi_schema
 
-@app.post("/reopt/run")
-async def run_reopt(scenario: Scenario, solver: Optional[str] = Query(None)):
+
+app.openapi = _openapi
+
+
+@app.post(
+    "/reopt/run",
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Scenario"}}},
+            "required": True,
+        }
+    },
+)
+async def run_reopt(request: Request, solver: Optional[str] = Query(None)):
     """Kick off a REopt run and return a run identifier."""
+    # Validate straight from the raw body: pydantic's JSON parser builds the
+    # typed model in one pass instead of decoding to generic dicts first.
+    try:
+        scenario = Scenario.model_validate_json(await request.body())
+    except ValidationError as exc:
+        # same error locations FastAPI reports for a declared body parameter
+        raise RequestValidationError([{**e, "loc": ("body", *e["loc"])} for e in exc.errors()])
+
     run_id = str(uuid.uuid4())
     run_dir = RUNS_DIR / run_id
     run_dir.mkdir(parents=True, exist_ok=True)
+    work_dir = _work_dir(run_id)
+    work_dir.mkdir(parents=True, exist_ok=True)
 
-    scenario_file = run_dir / "scenario.json"
-    result_file = run_dir / "result.json"
+    scenario_file = work_dir / "scenario.json"
+    result_file = work_dir / "result.json"
     # Normalize and log the scenario received from the client
-    try:
-        raw = json.loads(scenario.json())
-    except Exception:
-        raw = json.loads(scenario.json())
-
-    normalized = _normalize_scenario(raw)
-    scenario_json_str = json.dumps(normalized, indent=2)
-    print(f"[DEBUG] Received (normalized) scenario for run_id={run_id}: {scenario_json_str}")
-    scenario_file.write_text(scenario_json_str)
-    (run_dir / "status.json").write_text(json.dumps({"status": "running"}))
+    normalized = _normalize_scenario(scenario.model_dump(exclude_unset=True))
+    # Compact on disk; Julia reads it as data
+    scenario_bytes = orjson.dumps(normalized, option=orjson.OPT_SERIALIZE_NUMPY)
+    if log.isEnabledFor(logging.DEBUG):
+        # size and short hash only; the full body is in scenario.json
+        log.debug(
+            "Received (normalized) scenario for run_id=%s: %d bytes, sha1=%s",
+            run_id, len(scenario_bytes), hashlib.sha1(scenario_bytes).hexdigest()[:8],
+        )
+    await _awrite_bytes(scenario_file, scenario_bytes)
+    await _awrite_status(run_dir / "status.json", {"status": "queued"})
 
-    print(f"[DEBUG] Starting background Julia task for run_id={run_id}")
+    log.debug("Starting background Julia task for run_id=%s", run_id)
     asyncio.create_task(
         _run_julia(run_id, scenario_file, result_file, solver or DEFAULT_SOLVER)
     )
@@ -291,23 +689,45 @@ async def run_reopt(scenario: Scenario, solver: Optional[str] = Query(None)):
 
 
 @app.get("/reopt/result/{run_id}")
-async def get_result(run_id: str):
+async def get_result(run_id: str, request: Request):
     """Retrieve results or current status for a given run."""
     run_dir = RUNS_DIR / run_id
     status_path = run_dir / "status.json"
     if not status_path.exists():
         raise HTTPException(status_code=404, detail="run_id not found")
 
-    status = json.loads(status_path.read_text())
+    status = await _aload_json(status_path)
     if status.get("status") != "completed":
         return status
 
-    result_file = run_dir / "result.json"
+    result_file = _result_path(run_dir)
     if not result_file.exists():  # pragma: no cover - defensive
         return {"status": "error", "error": "result missing"}
 
-    result = json.loads(result_file.read_text())
-    return {"status": "completed", "result": result}
+    etag = _result_etag(result_file)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    # result.json was validated when the run completed; stream it through
+    # inside the wrapper instead of decoding and re-encoding it
+    return StreamingResponse(
+        _iter_wrapped_result(result_file), media_type="application/json", headers={"ETag": etag}
+    )
+
+
+def _result_etag(result_file: Path) -> str:
+    """Validator for a completed result; changes whenever the file does."""
+    st = result_file.stat()
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _iter_wrapped_result(result_file: Path):
+    """Yield `{"status": "completed", "result": <result file>}` in chunks."""
+    yield b'{"status":"completed","result":'
+    opener = gzip.open if result_file.suffix == ".gz" else open
+    with opener(result_file, "rb") as f:
+        while chunk := f.read(1 << 16):
+            yield chunk
+    yield b"}"
 
 
 # ============================================================
@@ -335,6 +755,20 @@ try:
 except Exception:
     _find_urdb_rates = None
 
+# Nearby-rate lookups by (lat, lon) rounded to ~10 m; URDB data changes rarely
+URDB_CACHE_TTL = 3600.0
+_URDB_CACHE_SIZE = 256
+_URDB_CACHE: "OrderedDict[tuple, tuple[float, list]]" = OrderedDict()
+
+def _compact_rate(r: dict) -> dict:
+    get = r.get
+    return {
+        "label": get("label") or get("urdb_label") or "",
+        "utility": get("utility") or get("utility_name") or "",
+        "name": get("name") or get("rate_name") or "",
+    }
+
+
 @app.get("/urdb")
 async def urdb(lat: float = Query(...), lon: float = Query(...)):
     """
@@ -343,28 +777,47 @@ async def urdb(lat: float = Query(...), lon: float = Query(...)):
     """
     if _find_urdb_rates is None:
         return []
+    key = (round(lat, 4), round(lon, 4))
+    hit = _URDB_CACHE.get(key)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
     try:
-        rates = _find_urdb_rates(lat, lon)
-        out = []
-        for r in rates:
-            out.append({
-                "label": r.get("label") or r.get("urdb_label") or "",
-                "utility": r.get("utility") or r.get("utility_name") or "",
-                "name": r.get("name") or r.get("rate_name") or "",
-            })
-        return out
+        rates = await asyncio.to_thread(_find_urdb_rates, lat, lon)
+        out = [_compact_rate(r) for r in rates]
     except Exception:
         return []
+    # failed lookups are not cached, so the next request retries them
+    _URDB_CACHE[key] = (time.monotonic() + URDB_CACHE_TTL, out)
+    _URDB_CACHE.move_to_end(key)
+    if len(_URDB_CACHE) > _URDB_CACHE_SIZE:
+        _URDB_CACHE.popitem(last=False)
+    return out
 
 
 # POST /submit: accept a raw scenario dict, normalize, launch a run; return {"run_uuid": "..."}
-@app.post("/submit")
-async def submit(scenario: dict = Body(...)):
+@app.post(
+    "/submit",
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": {"type": "object"}}},
+            "required": True,
+        }
+    },
+)
+async def submit(request: Request):
     """
     Frontend-friendly submit.
     Accepts a raw scenario dict (more permissive than the Pydantic Scenario),
     normalizes it using the same logic, and launches the Julia task.
     """
+    raw = await request.body()
+    try:
+        scenario = orjson.loads(raw)
+    except orjson.JSONDecodeError as exc:
+        raise RequestValidationError([{"type": "json_invalid", "loc": ("body",), "msg": str(exc), "input": None}])
+    if not isinstance(scenario, dict):
+        raise RequestValidationError([{"type": "dict_type", "loc": ("body",), "msg": "Input should be a valid dictionary", "input": None}])
+
     try:
         normalized = _normalize_scenario(scenario)
     except Exception:
@@ -374,16 +827,27 @@ async def submit(scenario: dict = Body(...)):
         run_id = str(uuid.uuid4())
         run_dir = RUNS_DIR / run_id
         run_dir.mkdir(parents=True, exist_ok=True)
+        work_dir = _work_dir(run_id)
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        scenario_file = work_dir / "scenario.json"
+        result_file = work_dir / "result.json"
+
+        # An already-normalized payload is written back byte-for-byte
+        if normalized is scenario:
+            scenario_bytes = raw
+        else:
+            scenario_bytes = orjson.dumps(normalized, option=orjson.OPT_SERIALIZE_NUMPY)
+        if log.isEnabledFor(logging.DEBUG):
+            # size and short hash only; the full body is in scenario.json
+            log.debug(
+                "Received (normalized) scenario for run_id=%s: %d bytes, sha1=%s",
+                run_id, len(scenario_bytes), hashlib.sha1(scenario_bytes).hexdigest()[:8],
+            )
+        await _awrite_bytes(scenario_file, scenario_bytes)
+        await _awrite_status(run_dir / "status.json", {"status": "queued"})
 
-        scenario_file = run_dir / "scenario.json"
-        result_file = run_dir / "result.json"
-
-        scenario_json_str = json.dumps(normalized, indent=2)
-        print(f"[DEBUG] Received (normalized) scenario for run_id={run_id}: {scenario_json_str}")
-        scenario_file.write_text(scenario_json_str)
-        (run_dir / "status.json").write_text(json.dumps({"status": "running"}))
-
-        print(f"[DEBUG] Starting background Julia task for run_id={run_id}")
+        log.debug("Starting background Julia task for run_id=%s", run_id)
         asyncio.create_task(
             _run_julia(run_id, scenario_file, result_file, os.getenv("REOPT_SOLVER", DEFAULT_SOLVER))
         )
@@ -395,31 +859,81 @@ async def submit(scenario: dict = Body(...)):
 
 # GET /status/{run_uuid}: return full results (flat), or interim status while running
 @app.get("/status/{run_uuid}")
-async def status(run_uuid: str):
+async def status(run_uuid: str, request: Request, wait: int = Query(0, ge=0, le=60)):
     """
     Return the full results JSON with a top-level 'status' once complete.
     While running, returns whatever is in status.json (e.g., {"status":"running"}).
+
+    With `wait` > 0 the request long-polls: it holds for up to that many
+    seconds until the run finishes, so clients can poll far less often.
     """
     run_dir = RUNS_DIR / run_uuid
     status_path = run_dir / "status.json"
     if not status_path.exists():
         raise HTTPException(status_code=404, detail="run_uuid not found")
 
-    status_data = json.loads(status_path.read_text())
+    status_data = await _aload_json(status_path)
+    if wait:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        delay = 1.0
+        while status_data.get("status") not in _TERMINAL_STATUSES:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 10.0)
+            status_data = await _aload_json(status_path)
+    if status_data.get("status") not in _TERMINAL_STATUSES and not wait:
+        # Tell short-polling clients to back off the longer a run stays pending
+        count = _POLL_COUNTS.pop(run_uuid, 0) + 1
+        _POLL_COUNTS[run_uuid] = count
+        if len(_POLL_COUNTS) > _MAX_TRACKED_POLLS:
+            _POLL_COUNTS.popitem(last=False)
+        retry_after = min(60, 3 + 2 ** min(count, 6))
+        return OrjsonResponse(
+            {**status_data, "retry_after": retry_after},
+            headers={"Retry-After": str(retry_after)},
+        )
+    _POLL_COUNTS.pop(run_uuid, None)
     if status_data.get("status") != "completed":
         return status_data
 
-    result_file = run_dir / "result.json"
+    result_file = _result_path(run_dir)
     if not result_file.exists():
         return {"status": "error", "error": "result missing"}
 
+    # a client re-polling a result it already has gets an empty 304
+    etag = _result_etag(result_file)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
     try:
-        results = json.loads(result_file.read_text())
+        body = await _coalesced(_completed_status_body, str(result_file), result_file.stat().st_mtime_ns)
     except Exception as exc:
         return {"status": "error", "error": f"bad result json: {exc}"}
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
-    if isinstance(results, dict):
-        results["status"] = "completed"
-        return results
-    else:
-        return {"status": "completed", "result": results}
+
+class StatusBatch(BaseModel):
+    run_uuids: list[str] = Field(max_length=100)
+
+
+async def _run_status(run_uuid: str) -> dict:
+    """status.json for one run, or {"status": "not_found"}."""
+    status_path = RUNS_DIR / run_uuid / "status.json"
+    # plain directory names only; the ids come from a request body
+    if run_uuid in ("", "..") or Path(run_uuid).name != run_uuid or not status_path.exists():
+        return {"status": "not_found"}
+    return await _aload_json(status_path)
+
+
+# POST /status_batch: statuses for several runs in one round trip
+@app.post("/status_batch")
+async def status_batch(batch: StatusBatch):
+    """
+    Return {run_uuid: status} for up to 100 runs at once, for clients tracking
+    several jobs. Only the status.json contents are returned; fetch completed
+    results individually from /status/{run_uuid}.
+    """
+    statuses = await asyncio.gather(*(_run_status(u) for u in batch.run_uuids))
+    return dict(zip(batch.run_uuids, statuses))
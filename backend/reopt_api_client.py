@@ -1,22 +1,31 @@
 import asyncio
-import json
+import hashlib
+import logging
 import os
 import uuid
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from fastapi import FastAPI, HTTPException, Query, Body
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-import copy
-from pathlib import Path as _Path
 
 # --- optional CORS so Streamlit/frontend can call this API ---
 from fastapi.middleware.cors import CORSMiddleware
 
+log = logging.getLogger("reopt.api")
+
 # Configuration via environment variables
 PROJECT_ROOT = Path(os.getenv("REOPT_PROJECT_ROOT", Path(__file__).resolve().parents[1]))
 RUNS_DIR = Path(os.getenv("REOPT_RUNS_DIR", Path(__file__).parent / "runs"))
 DEFAULT_SOLVER = os.getenv("REOPT_SOLVER", "HiGHS")
+# Upper bound on Julia solver processes running at once; further runs queue
+MAX_CONCURRENT_RUNS = int(os.getenv("REOPT_MAX_CONCURRENCY", os.cpu_count() or 2))
+# Number of warm Julia worker processes; 0 spawns one process per run
+JULIA_WORKERS = int(os.getenv("REOPT_JULIA_WORKERS", "0"))
 
 # Load a backend-local .env file if present. This allows operators to place
 # a `backend/.env` file (repo-local) containing `REOPT_NREL_API_KEY=...` and
@@ -38,22 +47,211 @@ if _env_path.exists():
             os.environ.setdefault(k, v)
     except Exception:
         # don't fail startup if env file is malformed; log debug and continue
-        print("[DEBUG] Failed to load backend/.env; continuing without it.")
+        log.debug("Failed to load backend/.env; continuing without it.")
 
 RUNS_DIR.mkdir(parents=True, exist_ok=True)
 
-app = FastAPI(title="REopt Runner")
+_JULIA_SLOTS = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+
+# How much of the end of a Julia log is kept in an error status
+LOG_TAIL_BYTES = 16 * 1024
+
+# Seconds a client should wait before re-polling a run that is still pending
+STATUS_RETRY_AFTER = 5
+
 
-# Allow all origins by default; tighten for production if you want
+def _julia_env() -> dict:
+    """Environment for Julia processes. Copies the current env and forwards a
+    backend-specific API key if provided, so operators can set
+    REOPT_NREL_API_KEY in the backend environment and have Julia pick it up
+    as NREL_DEVELOPER_API_KEY."""
+    env = os.environ.copy()
+    reopt_key = os.getenv("REOPT_NREL_API_KEY")
+    if reopt_key:
+        env["NREL_DEVELOPER_API_KEY"] = reopt_key
+    return env
+
+
+class JuliaWorkerPool:
+    """Long-lived `julia scripts/worker.jl` processes that keep REopt loaded
+    between runs, so only a worker's first job pays Julia's startup and
+    compilation cost. Jobs and replies are exchanged as one JSON object per
+    line over the worker's stdin/stdout.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        # every live worker, idle or busy, so close() can stop them all
+        self._procs: set = set()
+
+    async def start(self) -> None:
+        for _ in range(self.size):
+            self._idle.put_nowait(await self._spawn())
+
+    async def close(self) -> None:
+        """Stop every worker, including ones still busy with a job; their
+        pending run() calls then report the worker's exit as an error."""
+        procs, self._procs = self._procs, set()
+        for proc in procs:
+            if proc.returncode is None:
+                proc.terminate()
+        for proc in procs:
+            await proc.wait()
+
+    async def _spawn(self):
+        # Worker stderr (REopt/solver logging) goes to the server's stderr
+        proc = await asyncio.create_subprocess_exec(
+            "julia",
+            str(PROJECT_ROOT / "scripts" / "worker.jl"),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=_julia_env(),
+        )
+        self._procs.add(proc)
+        return proc
+
+    def _discard(self, proc) -> None:
+        """Kill a worker whose stdout may no longer line up with its jobs."""
+        self._procs.discard(proc)
+        if proc.returncode is None:
+            proc.kill()
+
+    async def run(self, job: dict, on_start=None) -> dict:
+        """Run one job on the next idle worker and return its reply.
+
+        `on_start`, if given, is awaited once a worker has been picked. A
+        worker found dead is replaced before use; one that dies mid-job is
+        reported as an error and replaced on its next use. A worker whose
+        reply can't be read or belongs to another job is killed and replaced
+        too, so a stray line can never complete the wrong run.
+        """
+        proc = await self._idle.get()
+        try:
+            if proc is None or proc.returncode is not None:
+                self._procs.discard(proc)
+                proc = await self._spawn()
+            if on_start is not None:
+                await on_start()
+            job_id = uuid.uuid4().hex
+            try:
+                try:
+                    proc.stdin.write(orjson.dumps({**job, "id": job_id}) + b"\n")
+                    await proc.stdin.drain()
+                    line = await proc.stdout.readline()
+                except (BrokenPipeError, ConnectionResetError):
+                    line = b""
+                if not line:
+                    returncode = await proc.wait()
+                    return {"ok": False, "error": f"Julia worker exited with code {returncode}"}
+                reply = orjson.loads(line)
+                if not isinstance(reply, dict) or reply.get("id") != job_id:
+                    raise ValueError("reply does not belong to this job")
+                return reply
+            except BaseException as exc:
+                # oversized or garbled reply, or run() cancelled mid-job
+                self._discard(proc)
+                bad, proc = proc, None
+                if not isinstance(exc, Exception):
+                    raise
+                await bad.wait()
+                return {"ok": False, "error": f"Julia worker failed: {exc}"}
+        finally:
+            # None stands in for a discarded worker; it is respawned on next use
+            self._idle.put_nowait(proc)
+
+
+# Set at startup when REOPT_JULIA_WORKERS > 0; otherwise every run spawns
+# its own `julia scripts/run_reopt.jl` process.
+JULIA_POOL: Optional[JuliaWorkerPool] = None
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    global JULIA_POOL
+    if JULIA_WORKERS > 0:
+        JULIA_POOL = JuliaWorkerPool(JULIA_WORKERS)
+        await JULIA_POOL.start()
+    try:
+        yield
+    finally:
+        if JULIA_POOL is not None:
+            await JULIA_POOL.close()
+            JULIA_POOL = None
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response encoded with orjson. Stands in for FastAPI's ORJSONResponse,
+    which is deprecated in current FastAPI releases."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+app = FastAPI(title="REopt Runner", default_response_class=OrjsonResponse, lifespan=_lifespan)
+
+# Only the configured frontend origins (comma-separated) may call the API;
+# defaults to the local Streamlit app.
+ALLOW_ORIGINS = [
+    o.strip() for o in os.getenv("REOPT_ALLOW_ORIGINS", "http://localhost:8501").split(",") if o.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],        # e.g., ["http://localhost:8501"]
+    allow_origins=ALLOW_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
 )
 
 
+# ElectricTariff keyword arguments accepted by the Julia constructor
+_ALLOWED_TX_KEYS = frozenset({
+    "urdb_label",
+    "urdb_response",
+    "urdb_utility_name",
+    "urdb_rate_name",
+    "year",
+    "time_steps_per_hour",
+    "NEM",
+    "wholesale_rate",
+    "export_rate_beyond_net_metering_limit",
+    "monthly_energy_rates",
+    "monthly_demand_rates",
+    "blended_annual_energy_rate",
+    "blended_annual_demand_rate",
+    "add_monthly_rates_to_urdb_rate",
+    "tou_energy_rates_per_kwh",
+    "add_tou_energy_rates_to_urdb_rate",
+    "remove_tiers",
+    "demand_lookback_months",
+    "demand_lookback_percent",
+    "demand_lookback_range",
+    "coincident_peak_load_active_time_steps",
+    "coincident_peak_load_charge_per_kw",
+})
+
+# Financial keyword arguments forwarded to Julia; anything else is dropped
+_ALLOWED_FIN_KEYS = frozenset({
+    "om_cost_escalation_rate_fraction",
+    "elec_cost_escalation_rate_fraction",
+    "offtaker_discount_rate_fraction",
+    "offtaker_tax_rate_fraction",
+    "third_party_ownership",
+    "bonus_depreciation_fraction",
+    "capital_incentive",
+    "analysis_years",
+    "itc",
+})
+
+# Defaults for Financial keys a scenario leaves unset
+_FIN_DEFAULTS = {
+    "om_cost_escalation_rate_fraction": 0.025,
+    "elec_cost_escalation_rate_fraction": 0.017,
+    "offtaker_tax_rate_fraction": 0.26,
+    "third_party_ownership": False,
+}
+
+
 class Scenario(BaseModel):
     """Minimal validation for REopt scenarios."""
     Site: dict
@@ -70,10 +268,12 @@ def _normalize_scenario(scn: dict) -> dict:
     """Normalize common shorthand fields from clients into the shapes
     expected by the Julia/REopt constructors.
     """
-    s = copy.deepcopy(scn)
+    # Shallow copies only: each section mutated below is copied on its own,
+    # and loads_kw can be shared with the caller.
+    s = dict(scn)
 
     # Validate Site.latitude and Site.longitude
-    site = s.get("Site", {}) or {}
+    site = dict(s.get("Site") or {})
     lat = site.get("latitude")
     lon = site.get("longitude")
     if lat is None or lon is None:
@@ -86,80 +286,22 @@ def _normalize_scenario(scn: dict) -> dict:
     s["Site"] = site
 
     # Ensure off_grid_flag and include_health_in_objective are in Settings
-    settings = s.get("Settings", {}) or {}
+    settings = dict(s.get("Settings") or {})
     settings["off_grid_flag"] = bool(settings.get("off_grid_flag", False))
     settings["include_health_in_objective"] = bool(settings.get("include_health_in_objective", False))
     s["Settings"] = settings
 
-    # Normalize Financial parameters
-    financial = s.get("Financial", {}) or {}
-    financial.setdefault("om_cost_escalation_rate_fraction", 0.025)
-    financial.setdefault("offtaker_tax_rate_fraction", 0.26)
-    financial.setdefault("third_party_ownership", False)
-
-    # Extend Financial normalization to include all required parameters
-    financial.setdefault("elec_cost_escalation_rate_fraction", 0.017)
-    financial.setdefault("existing_boiler_fuel_cost_escalation_rate_fraction", 0.015)
-    financial.setdefault("boiler_fuel_cost_escalation_rate_fraction", 0.015)
-    financial.setdefault("chp_fuel_cost_escalation_rate_fraction", 0.015)
-    financial.setdefault("generator_fuel_cost_escalation_rate_fraction", 0.012)
-    financial.setdefault("owner_tax_rate_fraction", 0.26)
-    financial.setdefault("owner_discount_rate_fraction", 0.0638)
-    financial.setdefault("value_of_lost_load_per_kwh", 1.00)
-    financial.setdefault("microgrid_upgrade_cost_fraction", 0.0)
-    financial.setdefault("macrs_five_year", [0.2, 0.32, 0.192, 0.1152, 0.1152, 0.0576])
-    financial.setdefault("macrs_seven_year", [0.1429, 0.2449, 0.1749, 0.1249, 0.0893, 0.0892, 0.0893, 0.0446])
-    financial.setdefault("offgrid_other_capital_costs", 0.0)
-    financial.setdefault("offgrid_other_annual_costs", 0.0)
-    financial.setdefault("min_initial_capital_costs_before_incentives", None)
-    financial.setdefault("max_initial_capital_costs_before_incentives", None)
-    financial.setdefault("CO2_cost_per_tonne", 51.0)
-    financial.setdefault("CO2_cost_escalation_rate_fraction", 0.042173)
-    financial.setdefault("NOx_grid_cost_per_tonne", None)
-    financial.setdefault("SO2_grid_cost_per_tonne", None)
-    financial.setdefault("PM25_grid_cost_per_tonne", None)
-    financial.setdefault("NOx_onsite_fuelburn_cost_per_tonne", None)
-    financial.setdefault("SO2_onsite_fuelburn_cost_per_tonne", None)
-    financial.setdefault("PM25_onsite_fuelburn_cost_per_tonne", None)
-    financial.setdefault("NOx_cost_escalation_rate_fraction", None)
-    financial.setdefault("SO2_cost_escalation_rate_fraction", None)
-    financial.setdefault("PM25_cost_escalation_rate_fraction", None)
-    financial.setdefault("include_health_in_objective", False)
-
-    # Filter out unexpected keys in Financial
-    allowed_financial_keys = {
-        "om_cost_escalation_rate_fraction",
-        "elec_cost_escalation_rate_fraction",
-        "offtaker_discount_rate_fraction",
-        "offtaker_tax_rate_fraction",
-        "third_party_ownership",
-        "bonus_depreciation_fraction",
-        "capital_incentive",
-        "analysis_years",
-        "itc"
-    }
-    financial = {k: v for k, v in financial.items() if k in allowed_financial_keys}
+    # Financial: defaults for unset keys, then only the keys Julia accepts
+    user_fin = s.get("Financial") or {}
+    financial = {k: v for k, v in {**_FIN_DEFAULTS, **user_fin}.items() if k in _ALLOWED_FIN_KEYS}
     s["Financial"] = financial
-
-    # Debugging: Log the final Financial section
-    print(f"[DEBUG] Final Financial section: {financial}")
-
-    # Remove invalid fields from Financial
-    # Enhanced cleanup logic with debug logging
-    invalid_financial_keys = {"latitude", "longitude", "off_grid_flag", "include_health_in_objective"}
-    for key in invalid_financial_keys:
-        if key in financial:
-            print(f"[DEBUG] Removing invalid key from Financial: {key}")
-            financial.pop(key)
-
-    # Debugging: Log the final Financial section after removing invalid keys
-    print(f"[DEBUG] Final Financial section after cleanup: {financial}")
+    log.debug("Final Financial section: %s", financial)
 
     # Read Settings.time_steps_per_hour if present (backwards-safe)
     settings_tph = (s.get("Settings", {}) or {}).get("time_steps_per_hour", None)
 
     # ElectricLoad normalization
-    el = s.get("ElectricLoad", {}) or {}
+    el = dict(s.get("ElectricLoad") or {})
     # legacy/front-end field -> expected REopt field
     if "hourly_profile" in el and "loads_kw" not in el:
         el["loads_kw"] = el.pop("hourly_profile")
@@ -190,15 +332,18 @@ def _normalize_scenario(scn: dict) -> dict:
     # Validate loads_kw if present: must be iterable and have expected length
     if "loads_kw" in el:
         loads = el.get("loads_kw")
+        if loads is None:
+            raise ValueError("ElectricLoad.loads_kw must be an array-like of numeric values")
         try:
-            # convert to list if not already; guard against None
-            if loads is None:
-                raise ValueError("ElectricLoad.loads_kw is None")
-            if not isinstance(loads, (list, tuple)):
+            # sized array-likes (lists, tuples, numpy arrays) are checked in place
+            len(loads)
+        except TypeError:
+            # one-shot iterables have to be materialized once
+            try:
                 loads = list(loads)
-                el["loads_kw"] = loads
-        except Exception:
-            raise ValueError("ElectricLoad.loads_kw must be an array-like of numeric values")
+            except TypeError:
+                raise ValueError("ElectricLoad.loads_kw must be an array-like of numeric values")
+            el["loads_kw"] = loads
 
         try:
             tph = int(el.get("time_steps_per_hour", 1))
@@ -211,7 +356,7 @@ def _normalize_scenario(scn: dict) -> dict:
             )
 
     # ElectricTariff normalization
-    tx = s.get("ElectricTariff", {}) or {}
+    tx = dict(s.get("ElectricTariff") or {})
     # Common shorthand: single energy charge -> blended annual energy rate
     if "energy_charge" in tx and "blended_annual_energy_rate" not in tx:
         ec = tx.get("energy_charge")
@@ -232,42 +377,64 @@ def _normalize_scenario(scn: dict) -> dict:
     tx.setdefault("NEM", bool(tx.get("NEM", False)))
 
     # Only keep keys ElectricTariff constructor expects to avoid kwcall MethodError in Julia
-    allowed_tx_keys = {
-        "urdb_label",
-        "urdb_response",
-        "urdb_utility_name",
-        "urdb_rate_name",
-        "year",
-        "time_steps_per_hour",
-        "NEM",
-        "wholesale_rate",
-        "export_rate_beyond_net_metering_limit",
-        "monthly_energy_rates",
-        "monthly_demand_rates",
-        "blended_annual_energy_rate",
-        "blended_annual_demand_rate",
-        "add_monthly_rates_to_urdb_rate",
-        "tou_energy_rates_per_kwh",
-        "add_tou_energy_rates_to_urdb_rate",
-        "remove_tiers",
-        "demand_lookback_months",
-        "demand_lookback_percent",
-        "demand_lookback_range",
-        "coincident_peak_load_active_time_steps",
-        "coincident_peak_load_charge_per_kw",
-    }
-    filtered_tx = {k: v for k, v in tx.items() if k in allowed_tx_keys}
+    filtered_tx = {k: v for k, v in tx.items() if k in _ALLOWED_TX_KEYS}
     s["ElectricTariff"] = filtered_tx
 
     return s
 
 
+@lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int):
+    """Decode a JSON file once per (path, mtime) so polling clients don't
+    re-parse an unchanged result on every request. Callers must not mutate
+    the returned object."""
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+def _load_json(path: Path):
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write to a sibling temp file and swap it into place, so a concurrent
+    /status poll never reads a partially written file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _tail(path: Path, limit: int = LOG_TAIL_BYTES) -> str:
+    """The last `limit` bytes of a log file, decoded; "" if there is no log."""
+    try:
+        with path.open("rb") as f:
+            f.seek(max(0, path.stat().st_size - limit))
+            return f.read().decode(errors="ignore")
+    except FileNotFoundError:
+        return ""
+
+
 async def _run_julia(run_id: str, scenario_file: Path, result_file: Path, solver: str) -> None:
     """Execute the Julia model and persist results."""
     status_path = RUNS_DIR / run_id / "status.json"
     stdout_path = RUNS_DIR / run_id / "stdout.log"
     stderr_path = RUNS_DIR / run_id / "stderr.log"
-    print(f"[DEBUG] _run_julia started for run_id={run_id}")
+    log.debug("_run_julia started for run_id=%s", run_id)
+
+    if JULIA_POOL is not None:
+        job = {"scenario": str(scenario_file), "result": str(result_file), "solver": solver}
+        try:
+            reply = await JULIA_POOL.run(
+                job, on_start=lambda: asyncio.to_thread(_atomic_write_bytes, status_path, orjson.dumps({"status": "running"}))
+            )
+        except Exception as exc:
+            reply = {"ok": False, "error": f"Julia worker failed: {exc}"}
+        if not reply.get("ok"):
+            log.debug("Julia worker error for run_id=%s: %s", run_id, reply.get("error"))
+            status = {"status": "error", "error": reply.get("error", "")}
+            _atomic_write_bytes(status_path, orjson.dumps(status))
+            return
+        _record_result(run_id, status_path, result_file)
+        return
 
     cmd = [
         "julia",
@@ -277,55 +444,60 @@ async def _run_julia(run_id: str, scenario_file: Path, result_file: Path, solver
         solver,
     ]
 
-    # Prepare environment for the Julia subprocess. Copy current env and
-    # forward a backend-specific API key if provided. This lets operators
-    # set REOPT_NREL_API_KEY in the backend environment and have Julia
-    # pick it up as NREL_DEVELOPER_API_KEY.
-    env = os.environ.copy()
-    reopt_key = os.getenv("REOPT_NREL_API_KEY")
-    if reopt_key:
-        env["NREL_DEVELOPER_API_KEY"] = reopt_key
+    RUNS_DIR.joinpath(run_id).mkdir(parents=True, exist_ok=True)
 
-    proc = await asyncio.create_subprocess_exec(
-        *cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-        env=env,
-    )
-    print(f"[DEBUG] Julia process started for run_id={run_id}")
-    stdout, stderr = await proc.communicate()
-    print(f"[DEBUG] Julia process finished for run_id={run_id} with returncode={proc.returncode}")
+    # Wait for a free solver slot; the run stays "queued" until then
+    async with _JULIA_SLOTS:
+        _atomic_write_bytes(status_path, orjson.dumps({"status": "running"}))
+        # Julia writes straight into the log files, so the server never holds
+        # its output in memory however much a long solve prints
+        with stdout_path.open("wb") as stdout_f, stderr_path.open("wb") as stderr_f:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=stdout_f,
+                stderr=stderr_f,
+                env=_julia_env(),
+            )
+            log.debug("Julia process started for run_id=%s", run_id)
+            await proc.wait()
+    log.debug("Julia process finished for run_id=%s with returncode=%s", run_id, proc.returncode)
 
-    RUNS_DIR.joinpath(run_id).mkdir(parents=True, exist_ok=True)
-    stdout_path.write_bytes(stdout)
-    stderr_path.write_bytes(stderr)
-    print(f"[DEBUG] Wrote stdout and stderr for run_id={run_id}")
+    # only keep logs that have something in them
+    for path in (stdout_path, stderr_path):
+        if path.stat().st_size == 0:
+            path.unlink()
 
-    # Decode stdout/stderr for diagnostics
-    stdout_text = stdout.decode(errors="ignore") if stdout else ""
-    stderr_text = stderr.decode(errors="ignore") if stderr else ""
+    # Diagnostics only need the end of each log
+    stdout_text = _tail(stdout_path)
+    stderr_text = _tail(stderr_path)
 
     # Treat non-zero return codes and MethodError as fatal. Avoid treating every
     # occurrence of the string "ERROR" in logs as a fatal condition because
     # some packages emit non-fatal ERROR-level messages during precompilation.
     fatal = proc.returncode != 0 or ("MethodError" in stderr_text)
     if fatal:
-        print(f"[DEBUG] Julia process error for run_id={run_id}: returncode={proc.returncode}")
+        log.debug("Julia process error for run_id=%s: returncode=%s", run_id, proc.returncode)
         status = {"status": "error", "returncode": proc.returncode}
         if stderr_text:
             status["error"] = stderr_text
         if stdout_text:
             status["stdout"] = stdout_text
-        status_path.write_text(json.dumps(status))
+        _atomic_write_bytes(status_path, orjson.dumps(status))
         return
 
+    _record_result(run_id, status_path, result_file, stdout_text, stderr_text)
+
+
+def _record_result(
+    run_id: str, status_path: Path, result_file: Path, stdout_text: str = "", stderr_text: str = ""
+) -> None:
+    """Mark a finished run completed if it produced a readable result.json."""
     try:
         # Ensure result.json exists and is valid JSON; otherwise mark as error
-        data_text = result_file.read_text()
-        data = json.loads(data_text)
+        data = _load_json(result_file)
         status = {"status": "completed"}
-        status_path.write_text(json.dumps(status))
-        print(f"[DEBUG] Run completed for run_id={run_id}")
+        _atomic_write_bytes(status_path, orjson.dumps(status))
+        log.debug("Run completed for run_id=%s", run_id)
     except Exception as exc:  # pragma: no cover - defensive
         status = {"status": "error", "error": str(exc)}
         # include captured stdout/stderr to help debug why parsing failed
@@ -333,9 +505,9 @@ async def _run_julia(run_id: str, scenario_file: Path, result_file: Path, solver
             status["stderr"] = stderr_text
         if stdout_text:
             # keep snippet to avoid extremely large status files
-            status["stdout_snippet"] = stdout_text[:2000]
-        status_path.write_text(json.dumps(status))
-        print(f"[DEBUG] Exception in _run_julia for run_id={run_id}: {exc}")
+            status["stdout_snippet"] = stdout_text[-2000:]
+        _atomic_write_bytes(status_path, orjson.dumps(status))
+        log.debug("Exception in _run_julia for run_id=%s: %s", run_id, exc)
 
 
 @app.post("/reopt/run")
@@ -344,8 +516,13 @@ async def run_reopt(scenario: Scenario, solver: Optional[str] = Query(None)):
     # Normalize the scenario
     normalized_scenario = _normalize_scenario(scenario.dict())
 
-    # Log the normalized scenario for debugging
-    print(f"[DEBUG] Normalized Scenario: {json.dumps(normalized_scenario, indent=2)}")
+    # Serialize once, compactly: the same bytes are logged and handed to Julia
+    scenario_bytes = orjson.dumps(normalized_scenario, option=orjson.OPT_SERIALIZE_NUMPY)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "Normalized Scenario: %d bytes, sha1=%s",
+            len(scenario_bytes), hashlib.sha1(scenario_bytes).hexdigest()[:8],
+        )
 
     # Generate a unique run ID
     run_id = str(uuid.uuid4())
@@ -358,8 +535,7 @@ async def run_reopt(scenario: Scenario, solver: Optional[str] = Query(None)):
     scenario_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Write the normalized scenario to a file
-    with scenario_file.open("w") as f:
-        json.dump(normalized_scenario, f, indent=2)
+    scenario_file.write_bytes(scenario_bytes)
 
     # Run the Julia script
     await _run_julia(run_id, scenario_file, result_file, solver or DEFAULT_SOLVER)
@@ -375,7 +551,7 @@ async def get_result(run_id: str):
     if not status_path.exists():
         raise HTTPException(status_code=404, detail="run_id not found")
 
-    status = json.loads(status_path.read_text())
+    status = _load_json(status_path)
     if status.get("status") != "completed":
         return status
 
@@ -383,7 +559,7 @@ async def get_result(run_id: str):
     if not result_file.exists():  # pragma: no cover - defensive
         return {"status": "error", "error": "result missing"}
 
-    result = json.loads(result_file.read_text())
+    result = _load_json(result_file)
     return {"status": "completed", "result": result}
 
 
@@ -459,8 +635,8 @@ async def submit(scenario: dict = Body(...)):
         scenario_file = run_dir / "scenario.json"
         result_file = run_dir / "result.json"
 
-        scenario_file.write_text(json.dumps(normalized, indent=2))
-        (run_dir / "status.json").write_text(json.dumps({"status": "running"}))
+        scenario_file.write_bytes(orjson.dumps(normalized, option=orjson.OPT_SERIALIZE_NUMPY))
+        _atomic_write_bytes(run_dir / "status.json", orjson.dumps({"status": "queued"}))
 
         asyncio.create_task(
             _run_julia(run_id, scenario_file, result_file, os.getenv("REOPT_SOLVER", DEFAULT_SOLVER))
@@ -476,14 +652,20 @@ async def submit(scenario: dict = Body(...)):
 async def status(run_uuid: str):
     """
     Return the full results JSON with a top-level 'status' once complete.
-    While running, returns whatever is in status.json (e.g., {"status":"running"}).
+    While running, returns whatever is in status.json (e.g., {"status":"running"})
+    plus a Retry-After hint, so clients poll instead of holding a request open.
     """
     run_dir = RUNS_DIR / run_uuid
     status_path = run_dir / "status.json"
     if not status_path.exists():
         raise HTTPException(status_code=404, detail="run_uuid not found")
 
-    status_data = json.loads(status_path.read_text())
+    status_data = _load_json(status_path)
+    if status_data.get("status") not in ("completed", "error"):
+        return OrjsonResponse(
+            {**status_data, "retry_after": STATUS_RETRY_AFTER},
+            headers={"Retry-After": str(STATUS_RETRY_AFTER)},
+        )
     if status_data.get("status") != "completed":
         return status_data
 
@@ -492,7 +674,7 @@ async def status(run_uuid: str):
         return {"status": "error", "error": "result missing"}
 
     try:
-        results = json.loads(result_file.read_text())
+        results = _load_json(result_file)
     except Exception as exc:
         return {"status": "error", "error": f"bad result json: {exc}"}
 
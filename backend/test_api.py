@@ -7,6 +7,16 @@ from backend.api import app
 
 client = TestClient(app)
 
+
+@pytest.fixture
+def runs_dir(tmp_path, monkeypatch):
+    """Point the API's run directory at a per-test temp dir."""
+    import backend.api as api
+
+    monkeypatch.setattr(api, "RUNS_DIR", tmp_path)
+    return tmp_path
+
+
 def test_run_and_poll_for_result():
     print("Starting test_run_and_poll_for_result...")
     # Load the real 8760-hour profile from the .dat file
@@ -46,7 +56,7 @@ def test_run_and_poll_for_result():
     else:
         print("Timeout waiting for job to complete")
         assert False, "Timeout waiting for job to complete"
-def test_run_reopt_valid_payload():
+def test_run_reopt_valid_payload(runs_dir):
     dat_path = os.path.join(os.path.dirname(__file__), "../data/load_profiles/electric/crb8760_norm_Albuquerque_LargeOffice.dat")
     with open(dat_path) as f:
         loads_kw = [float(line.strip()) for line in f if line.strip()]
@@ -78,7 +88,7 @@ def test_run_reopt_missing_body():
 
 # Add more tests for valid/invalid payloads as needed
 
-def test_run_reopt():
+def test_run_reopt(runs_dir):
     """Test the /reopt/run endpoint with a valid scenario."""
     scenario = {
         "Site": {"latitude": 34.05, "longitude": -118.25},
@@ -108,3 +118,331 @@ def test_run_reopt_invalid_scenario():
 
     response = client.post("/reopt/run", json={"scenario": scenario})
     assert response.status_code == 422
+
+
+def test_normalize_scenario_leaves_input_untouched():
+    """_normalize_scenario must not mutate the caller's scenario dict."""
+    from backend.api import _normalize_scenario
+
+    loads_kw = [1.0] * 8760
+    scenario = {
+        "Site": {"latitude": 40.0, "longitude": -105.0},
+        "ElectricLoad": {"hourly_profile": loads_kw},
+        "ElectricTariff": {"energy_charge": 0.1, "name": "x"},
+    }
+    normalized = _normalize_scenario(scenario)
+
+    assert scenario["ElectricLoad"] == {"hourly_profile": loads_kw}
+    assert scenario["ElectricTariff"] == {"energy_charge": 0.1, "name": "x"}
+    assert list(normalized["ElectricLoad"]["loads_kw"]) == loads_kw
+    assert normalized["ElectricTariff"]["blended_annual_energy_rate"] == 0.1
+
+
+def test_completed_result_is_served_from_disk(runs_dir):
+    """Completed runs return result.json via both result endpoints."""
+    run_id = "test-completed-run"
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "status.json").write_text(json.dumps({"status": "completed"}))
+    (run_dir / "result.json").write_text(json.dumps({"Financial": {"npv": 1.0}}))
+
+    for _ in range(2):
+        data = client.get(f"/status/{run_id}").json()
+        assert data == {"Financial": {"npv": 1.0}, "status": "completed"}
+
+    data = client.get(f"/reopt/result/{run_id}").json()
+    assert data == {"status": "completed", "result": {"Financial": {"npv": 1.0}}}
+
+    for path in (f"/status/{run_id}", f"/reopt/result/{run_id}"):
+        etag = client.get(path).headers["ETag"]
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+
+def test_compressed_result_is_served_from_disk(runs_dir):
+    """A gzip-compressed result.json.gz is read transparently."""
+    from backend.api import _compress_result
+
+    run_id = "test-compressed-run"
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "status.json").write_text(json.dumps({"status": "completed"}))
+    (run_dir / "result.json").write_text(json.dumps({"Financial": {"npv": 3.0}}))
+    _compress_result(run_dir / "result.json")
+    assert not (run_dir / "result.json").exists()
+
+    data = client.get(f"/status/{run_id}").json()
+    assert data == {"Financial": {"npv": 3.0}, "status": "completed"}
+    data = client.get(f"/reopt/result/{run_id}").json()
+    assert data == {"status": "completed", "result": {"Financial": {"npv": 3.0}}}
+
+
+@pytest.mark.parametrize("bad_value", [float("nan"), float("inf"), -1.0])
+def test_normalize_scenario_rejects_invalid_loads(bad_value):
+    from backend.api import _normalize_scenario
+
+    loads_kw = [1.0] * 8760
+    loads_kw[100] = bad_value
+    scenario = {
+        "Site": {"latitude": 40.0, "longitude": -105.0},
+        "ElectricLoad": {"loads_kw": loads_kw},
+        "ElectricTariff": {},
+    }
+    with pytest.raises(ValueError):
+        _normalize_scenario(scenario)
+
+
+def test_normalize_scenario_rejects_nested_loads():
+    from backend.api import _normalize_scenario
+
+    scenario = {
+        "Site": {"latitude": 40.0, "longitude": -105.0},
+        "ElectricLoad": {"loads_kw": [[1.0] * 8760]},
+        "ElectricTariff": {},
+    }
+    with pytest.raises(ValueError, match="not one-dimensional"):
+        _normalize_scenario(scenario)
+
+
+def test_run_reopt_rejects_non_numeric_loads():
+    """ElectricLoad.loads_kw is typed, so bad values fail validation up front."""
+    scenario = {
+        "Site": {"latitude": 34.05, "longitude": -118.25},
+        "ElectricLoad": {"loads_kw": ["abc"] * 8760, "year": 2025},
+        "ElectricTariff": {"blended_annual_energy_rate": 0.06},
+    }
+    response = client.post("/reopt/run", json=scenario)
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][:3] == ["body", "ElectricLoad", "loads_kw"]
+
+
+def test_run_reopt_schema_is_published():
+    """/reopt/run reads its raw body, so its models are registered by hand."""
+    schema = client.get("/openapi.json").json()
+    body = schema["paths"]["/reopt/run"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    assert body == {"$ref": "#/components/schemas/Scenario"}
+    components = schema["components"]["schemas"]
+    assert components["Scenario"]["properties"]["ElectricLoad"] == {"$ref": "#/components/schemas/ElectricLoad"}
+    assert "ElectricLoad" in components
+
+    response = client.post("/reopt/run", content=b"{not json", headers={"content-type": "application/json"})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == "body"
+
+
+def test_normalize_scenario_skips_normalized_input():
+    """An already-normalized scenario is returned as-is but still validated."""
+    from backend.api import _normalize_scenario
+
+    scenario = {
+        "Site": {"latitude": 40.0, "longitude": -105.0},
+        "ElectricLoad": {
+            "loads_kw": [1.0] * 8760,
+            "year": 2024,
+            "time_steps_per_hour": 1,
+            "operating_reserve_required_fraction": 0.0,
+        },
+        "ElectricTariff": {"blended_annual_energy_rate": 0.06, "time_steps_per_hour": 1, "year": 2024, "NEM": False},
+        "Financial": {"analysis_years": 25},
+    }
+    assert _normalize_scenario(scenario) is scenario
+
+    scenario["ElectricLoad"]["loads_kw"][0] = -1.0
+    with pytest.raises(ValueError):
+        _normalize_scenario(scenario)
+
+
+def test_submit_rejects_non_object_body():
+    response = client.post("/submit", json=[1, 2, 3])
+    assert response.status_code == 422
+
+
+def test_status_wait_returns_interim_status_on_timeout(runs_dir):
+    run_id = "test-queued-run"
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "status.json").write_text(json.dumps({"status": "queued"}))
+
+    start = time.monotonic()
+    response = client.get(f"/status/{run_id}", params={"wait": 1})
+    assert response.json() == {"status": "queued"}
+    assert time.monotonic() - start >= 1
+
+
+def test_status_retry_after_grows_while_pending(runs_dir):
+    run_id = "test-pending-run"
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "status.json").write_text(json.dumps({"status": "running"}))
+
+    hints = []
+    for _ in range(3):
+        response = client.get(f"/status/{run_id}")
+        assert response.json()["status"] == "running"
+        hints.append(int(response.headers["Retry-After"]))
+    assert hints == sorted(hints) and hints[0] < hints[-1]
+
+
+def test_coalesced_shares_concurrent_calls():
+    import asyncio
+    import threading
+    from backend.api import _coalesced
+
+    calls = []
+    release = threading.Event()
+
+    def slow_decode(path):
+        calls.append(path)
+        release.wait(5)
+        return {"path": path}
+
+    async def main():
+        waiters = [asyncio.ensure_future(_coalesced(slow_decode, "result.json")) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*waiters)
+
+    results = asyncio.run(main())
+    assert calls == ["result.json"]
+    assert results == [{"path": "result.json"}] * 5
+
+
+def test_status_batch_reports_each_run(runs_dir):
+    run_dir = runs_dir / "test-batch-run"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "status.json").write_text(json.dumps({"status": "running"}))
+
+    response = client.post("/status_batch", json={"run_uuids": ["test-batch-run", "missing", "../runs", ".."]})
+    assert response.status_code == 200
+    assert response.json() == {
+        "test-batch-run": {"status": "running"},
+        "missing": {"status": "not_found"},
+        "../runs": {"status": "not_found"},
+        "..": {"status": "not_found"},
+    }
+
+
+def test_urdb_lookups_are_cached(monkeypatch):
+    import backend.api as api
+
+    calls = []
+
+    def fake_find_rates(lat, lon):
+        calls.append((lat, lon))
+        return [{"urdb_label": "abc", "utility_name": "Util", "rate_name": "Rate"}]
+
+    monkeypatch.setattr(api, "_find_urdb_rates", fake_find_rates)
+    monkeypatch.setattr(api, "_URDB_CACHE", api.OrderedDict())
+    for _ in range(2):
+        response = client.get("/urdb", params={"lat": 40.0, "lon": -105.0})
+        assert response.json() == [{"label": "abc", "utility": "Util", "name": "Rate"}]
+    assert calls == [(40.0, -105.0)]
+
+
+# Stand-in for scripts/worker.jl: the job's "scenario" field picks how it replies
+FAKE_WORKER = '''#!{python}
+import json, os, sys, time
+for line in sys.stdin:
+    job = json.loads(line)
+    kind = os.path.basename(job["scenario"])
+    if kind == "ok":
+        with open(job["result"], "w") as f:
+            f.write('{{"npv": 1.0}}')
+        reply = json.dumps({{"id": job["id"], "ok": True}})
+    elif kind == "big":
+        reply = json.dumps({{"id": job["id"], "ok": False, "error": "x" * 100_000}})
+    elif kind == "garbage":
+        reply = "not json"
+    elif kind == "stale":
+        reply = json.dumps({{"id": "another-job", "ok": True}})
+    elif kind == "die":
+        sys.exit(3)
+    else:
+        time.sleep(60)
+        continue
+    print(reply, flush=True)
+'''
+
+
+@pytest.fixture
+def fake_julia(tmp_path, monkeypatch):
+    import sys
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    julia = bin_dir / "julia"
+    julia.write_text(FAKE_WORKER.format(python=sys.executable))
+    julia.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return tmp_path
+
+
+# Both apps carry their own copy of the worker pool
+@pytest.fixture(params=["backend.api", "backend.reopt_api_client"])
+def pool_module(request):
+    import importlib
+
+    return importlib.import_module(request.param)
+
+
+def test_worker_pool_recovers_from_bad_replies(fake_julia, pool_module):
+    import asyncio
+
+    JuliaWorkerPool = pool_module.JuliaWorkerPool
+
+    result = str(fake_julia / "result.json")
+
+    async def main():
+        pool = JuliaWorkerPool(1)
+        await pool.start()
+        replies = []
+        try:
+            for kind in ("ok", "big", "ok", "garbage", "ok", "stale", "ok", "die", "ok"):
+                replies.append(await pool.run({"scenario": kind, "result": result, "solver": "HiGHS"}))
+        finally:
+            await pool.close()
+        return replies
+
+    replies = asyncio.run(main())
+    assert [r["ok"] for r in replies] == [True, False, True, False, True, False, True, False, True]
+    assert "exited with code 3" in replies[7]["error"]
+
+
+def test_worker_pool_close_stops_busy_workers(fake_julia, pool_module):
+    import asyncio
+
+    JuliaWorkerPool = pool_module.JuliaWorkerPool
+
+    async def main():
+        pool = JuliaWorkerPool(1)
+        await pool.start()
+        job = asyncio.ensure_future(pool.run({"scenario": "hang", "result": "", "solver": "HiGHS"}))
+        await asyncio.sleep(0.5)
+        await asyncio.wait_for(pool.close(), 10)
+        return await asyncio.wait_for(job, 10)
+
+    reply = asyncio.run(main())
+    assert reply["ok"] is False
+
+
+def test_worker_pool_failure_is_recorded_as_error_status(fake_julia, pool_module, tmp_path, monkeypatch):
+    import asyncio
+
+    api = pool_module
+    monkeypatch.setattr(api, "RUNS_DIR", tmp_path)
+    run_dir = tmp_path / "test-worker-run"
+    run_dir.mkdir()
+
+    async def main():
+        pool = api.JuliaWorkerPool(1)
+        await pool.start()
+        monkeypatch.setattr(api, "JULIA_POOL", pool)
+        try:
+            await api._run_julia("test-worker-run", run_dir / "big", run_dir / "result.json", "HiGHS")
+        finally:
+            await pool.close()
+
+    asyncio.run(main())
+    status = json.loads((run_dir / "status.json").read_text())
+    assert status["status"] == "error"
@@ -0,0 +1,63 @@
+#!/usr/bin/env julia
+# Long-lived REopt worker used by the backend's JuliaWorkerPool.
+#
+# Reads one JSON job per line on stdin:
+#   {"id": "<job_id>", "scenario": "<input_json>", "result": "<output_json>", "solver": "HiGHS"}
+# runs REopt, writes the results to the given output file and answers with one
+# JSON line on stdout echoing the job id: {"id": "<job_id>", "ok": true} or
+# {"id": "<job_id>", "ok": false, "error": "<message>"}.
+# Packages stay loaded between jobs, so only the first job pays for startup and
+# compilation.
+
+# Keep the original stdout for replies; everything REopt/JuMP/the solver prints
+# goes to stderr so it can't be mistaken for a reply.
+const REPLY_IO = stdout
+redirect_stdout(stderr)
+
+import Pkg
+Pkg.activate(joinpath(@__DIR__, ".."))
+
+using REopt, JuMP
+import HiGHS
+import GLPK
+using JSON3
+
+function optimizer(solver::AbstractString)
+    if solver == "HiGHS"
+        return HiGHS.Optimizer
+    elseif solver == "GLPK"
+        return GLPK.GLPK.Optimizer
+    end
+    error("Unknown solver: $solver")
+end
+
+# Error messages are cut to this many characters so a reply stays one short line
+const MAX_ERROR_CHARS = 4000
+
+function reply(msg)
+    println(REPLY_IO, JSON3.write(msg))
+    flush(REPLY_IO)
+end
+
+function main()
+    for line in eachline(stdin)
+        isempty(strip(line)) && continue
+        id = nothing
+        try
+            job = JSON3.read(line)
+            id = get(job, :id, nothing)
+            m = Model(optimizer(String(job.solver)))
+            results = run_reopt(m, String(job.scenario))
+            JSON3.write(String(job.result), results)
+            reply(Dict("id" => id, "ok" => true))
+        catch e
+            msg = sprint(showerror, e)
+            if length(msg) > MAX_ERROR_CHARS
+                msg = first(msg, MAX_ERROR_CHARS) * "..."
+            end
+            reply(Dict("id" => id, "ok" => false, "error" => msg))
+        end
+    end
+end
+
+main()
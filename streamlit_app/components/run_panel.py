@@ -1,7 +1,9 @@
 import streamlit as st
 import json
+import logging
 import time
 import os
+import random
 from streamlit_app.utils.backend_client import (
     submit_scenario,
     get_status,
@@ -9,9 +11,16 @@ from streamlit_app.utils.backend_client import (
     submit_scenario_nrel,
     get_status_nrel,
     get_result_nrel,
+    NREL_API_KEY,
 )
 from utils.validators import build_reopt_scenario, preflight_checks
 
+log = logging.getLogger(__name__)
+
+# Terminal run states (lower-cased) from the local backend and the NREL API
+_DONE_STATUSES = frozenset({"completed", "complete", "finished", "success", "optimal"})
+_FAILED_STATUSES = frozenset({"failed", "error", "cancelled"})
+
 
 def show():
     st.subheader("🚀 Run Optimization")
@@ -59,10 +68,9 @@ def show():
         key="reopt_backend",
     )
 
-    # Hardcoded NREL API Key
-    nrel_api_key = "NLYEhO9rbdzeKihekZZkQf0DiaNNOXjsLw9fbgJE"
-
-    if backend_choice == "NREL API" and not nrel_api_key:
+    # NREL API key comes from the environment (NREL_API_KEY); the client sends
+    # it as a header, never inside the scenario or the URL
+    if backend_choice == "NREL API" and not NREL_API_KEY:
         st.error("NREL API Key is required for NREL API execution mode.")
         disable_run = True
 
@@ -72,12 +80,13 @@ def show():
 
         # Select appropriate backend helpers
         if backend_choice == "NREL API":
-            submit = lambda scenario: submit_scenario_nrel({"api_key": nrel_api_key, **scenario})
+            submit = submit_scenario_nrel
             status_fn = get_status_nrel
             result_fn = get_result_nrel
         else:
             submit = submit_scenario
-            status_fn = get_status
+            # long-poll the local backend so most runs need only a few requests
+            status_fn = lambda run_uuid: get_status(run_uuid, wait=20)
             result_fn = get_result
 
         with st.status("Submitting & optimizing...", expanded=True) as status:
@@ -100,7 +109,8 @@ def show():
                     try:
                         out = status_fn(run_uuid)
                         last_out = out
-                        print(f"[DEBUG] Backend response: {out}")  # Log backend response
+                        # lazy formatting: the completed response is the full multi-MB result
+                        log.debug("Backend response: %s", out)
                     except Exception as exc:
                         # Surface transient polling errors but keep retrying until timeout
                         status.update(label=f"Error polling backend: {exc}. Retrying…")
@@ -109,8 +119,9 @@ def show():
                             st.warning(f"Polling timed out after {timeout} seconds; last error: {exc}")
                             st.session_state["results"] = {"error": str(exc)}
                             break
-                        time.sleep(delay)
-                        delay = min(max_delay, delay * 1.5)
+                        # full jitter, so clients hit by the same outage don't retry in lockstep
+                        time.sleep(random.uniform(0, delay))
+                        delay = min(max_delay, delay * 2)
                         continue
 
                     # Interpret backend status fields flexibly
@@ -122,7 +133,7 @@ def show():
                     status_text = (str(status_field) if status_field is not None else "unknown").lower()
                     status.update(label=f"run_uuid={run_uuid} — status: {status_text}")
 
-                    if status_text in ("completed", "complete", "finished", "success"):
+                    if status_text in _DONE_STATUSES:
                         # The backend /status endpoint may return just a status dict
                         # or a wrapper containing the actual results. Try to normalize
                         # to a full results dict that UI components expect.
@@ -130,6 +141,11 @@ def show():
                             # If backend included 'result', unwrap it.
                             if "result" in out and isinstance(out.get("result"), dict):
                                 st.session_state["results"] = out.get("result")
+                            elif backend_choice != "NREL API" and "Financial" in out:
+                                # the local /status already returned the full (flat)
+                                # results (every REopt result has a Financial
+                                # section); don't download them a second time
+                                st.session_state["results"] = out
                             else:
                                 # Fetch the detailed result from /reopt/result/<id>
                                 try:
@@ -150,7 +166,7 @@ def show():
                         status.update(label="Complete", state="complete")
                         st.success("Optimization finished.")
                         break
-                    if status_text in ("failed", "error"):
+                    if status_text in _FAILED_STATUSES:
                         st.session_state["results"] = out
                         status.update(label="Failed", state="error")
                         st.error(f"Backend reported failure: {status_text}")
@@ -163,7 +179,10 @@ def show():
                         st.session_state["results"] = out
                         break
 
-                    # wait and retry with backoff
+                    # wait and retry with backoff, or as long as the backend asks
+                    retry_after = out.get("retry_after") if isinstance(out, dict) else None
+                    if isinstance(retry_after, (int, float)):
+                        delay = float(retry_after)
                     time.sleep(delay)
                     delay = min(max_delay, delay * 1.5)
 
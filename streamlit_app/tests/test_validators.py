@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure repo root and streamlit_app are on sys.path
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+if str(ROOT / "streamlit_app") not in sys.path:
+    sys.path.append(str(ROOT / "streamlit_app"))
+
+from streamlit_app.utils.validators import build_reopt_scenario
+
+
+@pytest.mark.parametrize("tph", [1, 4])
+def test_synthetic_load_profile_matches_peak_and_load_factor(tph):
+    state = {
+        "latitude": 40.0,
+        "longitude": -105.0,
+        "time_steps_per_hour": tph,
+        "ElectricLoad": {"peak_kw": 500.0, "load_factor": 0.6},
+    }
+    scn, _ = build_reopt_scenario(state)
+    loads = scn["ElectricLoad"]["loads_kw"]
+    steps_per_day = 24 * tph
+
+    assert len(loads) == 8760 * tph
+    assert loads[:steps_per_day] == loads[-steps_per_day:]
+    assert sum(loads) == pytest.approx(500.0 * 0.6 * 8760.0)
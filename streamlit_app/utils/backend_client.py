@@ -1,5 +1,33 @@
+import json
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional here; results are decoded with it when installed since
+# completed REopt results are multi-MB numeric JSON.
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+
+def _json(r: requests.Response):
+    """Decode a response body, preferring orjson over requests' stdlib json."""
+    if _orjson is not None:
+        return _orjson.loads(r.content)
+    return json.loads(r.content)
+
+
+def _dumps(obj) -> bytes:
+    """Encode a request body once (compact), for sending with data=."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode()
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 BACKEND_URL = os.getenv("VORTX_BACKEND_URL", "http://localhost:8000")
 
@@ -9,22 +37,51 @@ NREL_API_BASE = os.getenv(
 )
 NREL_API_KEY = os.getenv("NREL_API_KEY") or os.getenv("NREL_DEVELOPER_API_KEY")
 
+# Endpoint URLs, built once; per-run ones are filled in with str.format
+SCHEMA_URL = f"{BACKEND_URL}/schema"
+URDB_URL = f"{BACKEND_URL}/urdb"
+SUBMIT_URL = f"{BACKEND_URL}/submit"
+STATUS_URL_TMPL = BACKEND_URL + "/status/{}"
+RESULT_URL_TMPL = BACKEND_URL + "/reopt/result/{}"
+NREL_JOB_URL = f"{NREL_API_BASE}/job"
+NREL_STATUS_URL_TMPL = NREL_API_BASE + "/job/{}/status"
+NREL_RESULTS_URL_TMPL = NREL_API_BASE + "/job/{}/results"
+
+# NREL request headers, built once (None when no key is configured)
+_NREL_AUTH = {"X-Api-Key": NREL_API_KEY} if NREL_API_KEY else None
+_NREL_POST_HEADERS = {**_JSON_HEADERS, **_NREL_AUTH} if _NREL_AUTH else None
+
+# One shared session so repeated status polls reuse keep-alive connections
+# (and the TLS handshake to developer.nrel.gov) instead of reconnecting per call.
+# Connection failures and transient gateway errors on GETs are retried with a
+# short backoff; read timeouts are not (a hung long-poll would otherwise block
+# for several full timeouts), and POSTs are never retried so a job is not
+# submitted twice.
+SESSION = requests.Session()
+_retry = Retry(
+    total=3, read=0, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=frozenset({"GET"})
+)
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_retry)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+SESSION.headers.update({"User-Agent": "VortxOpt/1.0", "Accept": "application/json"})
+
 def get_schema():
-    r = requests.get(f"{BACKEND_URL}/schema", timeout=30)
+    r = SESSION.get(SCHEMA_URL, timeout=30)
     r.raise_for_status()
-    return r.json()
+    return _json(r)
 
 def get_urdb(lat: float, lon: float):
-    r = requests.get(f"{BACKEND_URL}/urdb", params={"lat": lat, "lon": lon}, timeout=30)
+    r = SESSION.get(URDB_URL, params={"lat": lat, "lon": lon}, timeout=30)
     r.raise_for_status()
-    return r.json()
+    return _json(r)
 
 def submit_scenario(payload: dict):
-    r = requests.post(f"{BACKEND_URL}/submit", json=payload, timeout=60)
+    r = SESSION.post(SUBMIT_URL, data=_dumps(payload), headers=_JSON_HEADERS, timeout=60)
     # Provide a clearer message if the backend rejects the request
     if r.status_code == 403:
         raise RuntimeError(
-            f"Backend returned 403 Forbidden for {BACKEND_URL}/submit.\n"
+            f"Backend returned 403 Forbidden for {SUBMIT_URL}.\n"
             "Verify the backend is running at this URL and that no proxy/auth is blocking the request.\n"
             f"Response: {r.text}"
         )
@@ -39,12 +96,15 @@ def submit_scenario(payload: dict):
         raise RuntimeError(f"Validation error from backend: {detail}")
 
     r.raise_for_status()
-    return r.json()
+    return _json(r)
 
-def get_status(run_uuid: str):
-    r = requests.get(f"{BACKEND_URL}/status/{run_uuid}", timeout=60)
+def get_status(run_uuid: str, wait: int = 0):
+    """Poll a local run. With `wait` > 0 the backend holds the request for up
+    to that many seconds until the run finishes (long polling)."""
+    params = {"wait": wait} if wait else None
+    r = SESSION.get(STATUS_URL_TMPL.format(run_uuid), params=params, timeout=60 + wait)
     r.raise_for_status()
-    return r.json()
+    return _json(r)
 
 
 def get_result(run_uuid: str):
@@ -56,40 +116,43 @@ def get_result(run_uuid: str):
     returns whatever the backend provides and leaves normalization to the
     caller.
     """
-    r = requests.get(f"{BACKEND_URL}/reopt/result/{run_uuid}", timeout=60)
+    r = SESSION.get(RESULT_URL_TMPL.format(run_uuid), timeout=60)
     r.raise_for_status()
-    return r.json()
+    return _json(r)
 
 
 # ---------------------------------------------------------------------------
 # NREL-hosted REopt API helpers
 # ---------------------------------------------------------------------------
 
-def _nrel_payload(payload: dict) -> dict:
-    """Wrap the scenario payload with API key for NREL-hosted runs."""
-    if not NREL_API_KEY:
+def _nrel_headers(post: bool = False) -> dict:
+    """Auth header for NREL-hosted runs. The key travels in X-Api-Key rather
+    than the query string or body so it never appears in URLs or logs."""
+    if _NREL_AUTH is None:
         raise RuntimeError("NREL_API_KEY environment variable not set")
-    return {"api_key": NREL_API_KEY, "scenario": payload}
+    return _NREL_POST_HEADERS if post else _NREL_AUTH
 
 
 def submit_scenario_nrel(payload: dict):
-    data = _nrel_payload(payload)
-    r = requests.post(f"{NREL_API_BASE}/job", json=data, timeout=60)
+    r = SESSION.post(
+        NREL_JOB_URL,
+        data=_dumps({"scenario": payload}),
+        headers=_nrel_headers(post=True),
+        timeout=60,
+    )
     r.raise_for_status()
-    return r.json()
+    return _json(r)
 
 
 def get_status_nrel(run_uuid: str):
-    params = {"api_key": NREL_API_KEY}
     # Many REopt API versions expose /job/<id>/status
-    r = requests.get(f"{NREL_API_BASE}/job/{run_uuid}/status", params=params, timeout=60)
+    r = SESSION.get(NREL_STATUS_URL_TMPL.format(run_uuid), headers=_nrel_headers(), timeout=60)
     r.raise_for_status()
-    return r.json()
+    return _json(r)
 
 
 def get_result_nrel(run_uuid: str):
-    params = {"api_key": NREL_API_KEY}
     # Final detailed results
-    r = requests.get(f"{NREL_API_BASE}/job/{run_uuid}/results", params=params, timeout=60)
+    r = SESSION.get(NREL_RESULTS_URL_TMPL.format(run_uuid), headers=_nrel_headers(), timeout=60)
     r.raise_for_status()
-    return r.json()
+    return _json(r)
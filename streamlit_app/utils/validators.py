@@ -1,13 +1,17 @@
+import math
+
+
 def _valid_tariff(scn: dict) -> bool:
     et = scn.get("ElectricTariff", {}) or {}
-    return any([
-        "urdb_label" in et,
-        ("blended_annual_energy_rate" in et and "blended_annual_demand_rate" in et),
-        ("monthly_energy_rates" in et and "monthly_demand_rates" in et),
-        "tou_energy_rates_per_kwh" in et,
-        "urdb_response" in et,
-        ("urdb_utility_name" in et and "urdb_rate_name" in et),
-    ])
+    # short-circuits on the first tariff form found (most often urdb_label)
+    return (
+        "urdb_label" in et
+        or ("blended_annual_energy_rate" in et and "blended_annual_demand_rate" in et)
+        or ("monthly_energy_rates" in et and "monthly_demand_rates" in et)
+        or "tou_energy_rates_per_kwh" in et
+        or "urdb_response" in et
+        or ("urdb_utility_name" in et and "urdb_rate_name" in et)
+    )
 
 def _validate_load(scn: dict) -> str | None:
     el = scn.get("ElectricLoad", {}) or {}
@@ -66,9 +70,10 @@ def build_reopt_scenario(state: dict) -> tuple[dict, list]:
         or bool(card("Settings").get("off_grid_flag"))
     )
     # Allow the user to enter a 'site_location' free-text field containing either 'lat, lon' or a 5-digit ZIP
-    site_loc = sget("site_location") or card("Site").get("site_location")
-    lat = sget("latitude") or card("Site").get("latitude")
-    lon = sget("longitude") or card("Site").get("longitude")
+    site_card = card("Site")
+    site_loc = sget("site_location") or site_card.get("site_location")
+    lat = sget("latitude") or site_card.get("latitude")
+    lon = sget("longitude") or site_card.get("longitude")
     # simple ZIP resolver map (small built-in list for quick testing)
     zip_map = {
         "80302": (40.0150, -105.2705),  # Boulder, CO
@@ -115,21 +120,20 @@ def build_reopt_scenario(state: dict) -> tuple[dict, list]:
             try:
                 peak_f = float(peak)
                 lf_f = float(lf)
-                total_steps = 8760 * int(tph)
+                steps_per_day = 24 * int(tph)
                 base = peak_f * 0.1
                 amp = peak_f - base
-                profile = []
-                for step in range(total_steps):
-                    hour = (step / tph) % 24
-                    x = 0.5 * (1 + __import__("math").cos((hour - 16) / 24.0 * 2 * __import__("math").pi))
-                    val = base + x * amp
-                    profile.append(val)
+                # every day has the same shape: build one day, scale it, repeat it
+                day = []
+                for step in range(steps_per_day):
+                    hour = step / tph
+                    x = 0.5 * (1 + math.cos((hour - 16) / 24.0 * 2 * math.pi))
+                    day.append(base + x * amp)
                 # scale to match annual energy = peak * lf * 8760
                 annual_kwh = peak_f * lf_f * 8760.0
-                current_sum = sum(profile)
+                current_sum = sum(day) * 365
                 scale = (annual_kwh / current_sum) if current_sum > 0 else 1.0
-                profile = [v * scale for v in profile]
-                el["loads_kw"] = profile
+                el["loads_kw"] = [v * scale for v in day] * 365
                 el["year"] = el_state.get("year", 2024)
                 el["peak_kw"] = peak_f
                 el["load_factor"] = lf_f
@@ -177,16 +181,19 @@ def build_reopt_scenario(state: dict) -> tuple[dict, list]:
     es.setdefault("macrs_bonus_fraction", bonus)
 
     # NG (CHP) and Diesel map straight through if user enabled them in your cards
-    if card("CHP"):
-        scn["CHP"] = card("CHP")
-    if card("Generator"):
-        scn["Generator"] = card("Generator")
+    chp = card("CHP")
+    if chp:
+        scn["CHP"] = chp
+    gen = card("Generator")
+    if gen:
+        scn["Generator"] = gen
 
     # Resilience / ElectricUtility
     eu = {}
-    el["critical_load_fraction"] = sget("critical_load_fraction", card("ElectricLoad").get("critical_load_fraction", 1.0))
-    start = sget("outage_start_time_step", card("ElectricUtility").get("outage_start_time_step"))
-    end = sget("outage_end_time_step", card("ElectricUtility").get("outage_end_time_step"))
+    eu_card = card("ElectricUtility")
+    el["critical_load_fraction"] = sget("critical_load_fraction", el_state.get("critical_load_fraction", 1.0))
+    start = sget("outage_start_time_step", eu_card.get("outage_start_time_step"))
+    end = sget("outage_end_time_step", eu_card.get("outage_end_time_step"))
     if start and end:
         eu["outage_start_time_step"] = int(start)
         eu["outage_end_time_step"]   = int(end)